@@ -0,0 +1,39 @@
+import argparse
+
+from hockey.action import Action
+from hockey2.game_archive import GameArchive
+from hockey2.game_archive import build_archive
+from hockey2.game_record import RecordReader
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Build and query a memory-mapped game archive.')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+    build = subparsers.add_parser('build', help='append the games of a record file to an archive')
+    build.add_argument('record')
+    build.add_argument('archive')
+    stats = subparsers.add_parser('stats', help='summarize an archive')
+    stats.add_argument('archive')
+    return parser.parse_args()
+
+
+def print_stats(archive):
+    print('{} games, {} moves'.format(len(archive), len(archive.moves)))
+    print('  first mover: {:.1%} wins'.format(archive.first_mover_win_rate()))
+    for reason, count in sorted(archive.reasons().items(), key=lambda item: -item[1]):
+        print('  {}: {}'.format(reason, count))
+    print('  length p10/p50/p90: {:.0f} / {:.0f} / {:.0f}'.format(*archive.length_percentiles()))
+    print('  power moves: {}'.format(archive.power_moves()))
+    directions = archive.direction_counts()
+    print('  ' + ', '.join('{}: {}'.format(Action.from_number(n), directions[n]) for n in range(Action.POWER)))
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.command == 'build':
+        reader = RecordReader(args.record)
+        build_archive(reader, args.archive)
+        reader.close()
+    else:
+        print_stats(GameArchive(args.archive))
@@ -0,0 +1,83 @@
+import abc
+
+from client import AlphaBetaHockeyClient
+from client import MctsHockeyClient
+from client import RandomHockeyClient
+from hockey.action import Action
+
+
+ABC = abc.ABCMeta('ABC', (object,), {})
+
+
+class Bot(ABC):
+    def __init__(self, name, rng):
+        self.name = name
+        self.rng = rng
+
+    def game_started(self, controller, goal):
+        pass
+
+    def polarity_inverted(self):
+        pass
+
+    def player_moved(self, player, action):
+        pass
+
+    @abc.abstractmethod
+    def play(self, controller):
+        # returns the action number to play for the active player, any exception forfeits the game
+        pass
+
+
+class RandomBot(Bot):
+    def play(self, controller):
+        return self.rng.choice(controller.get_possible_actions(*controller.ball))
+
+
+class ClientBot(Bot):
+    def __init__(self, client, name, rng):
+        super(ClientBot, self).__init__(name, rng)
+        self.client = client
+        self.msgid = 0
+
+    def game_started(self, controller, goal):
+        self.client.board_size(controller.size_x, controller.size_y)
+        self.client.ball_at(controller.ball[0], controller.ball[1], self._next_msgid())
+        self.client.goal_is(goal)
+        power_up_position = getattr(controller, 'power_up_position', None)
+        if power_up_position is not None:
+            self.client.power_up_at(*power_up_position)
+
+    def polarity_inverted(self):
+        self.client.polarity_inverted()
+
+    def player_moved(self, player, action):
+        self.client.player_moved(player, action, self._next_msgid())
+
+    def play(self, controller):
+        return Action.to_number(self.client.choose_move())
+
+    def _next_msgid(self):
+        self.msgid += 1
+        return self.msgid
+
+
+def client_bot(name, rng):
+    return ClientBot(RandomHockeyClient(name, False), name, rng)
+
+
+# fixed depth and rollout budgets rather than wall time, so that seeded matches replay the same games
+def alphabeta_bot(name, rng):
+    return ClientBot(AlphaBetaHockeyClient(name, False, time_budget=None, max_depth=6), name, rng)
+
+
+def mcts_bot(name, rng):
+    return ClientBot(MctsHockeyClient(name, False, iterations=150, rng=rng), name, rng)
+
+
+BOTS = {
+    'random': RandomBot,
+    'client': client_bot,
+    'alphabeta': alphabeta_bot,
+    'mcts': mcts_bot,
+}
@@ -0,0 +1,140 @@
+import random
+import time
+from collections import Counter
+
+from twisted.logger import Logger
+
+
+class MatchResult(object):
+    def __init__(self, players, seed, winner, reason, moves, invalid, duration):
+        self.players = players
+        self.seed = seed
+        self.winner = winner
+        self.reason = reason
+        self.moves = moves
+        self.invalid = invalid
+        self.duration = duration
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __str__(self):
+        return '{} VS {}: {} won {} after {} moves'.format(self.players[0], self.players[1], self.winner, self.reason,
+                                                          self.moves)
+
+
+class Match(object):
+    log = Logger()
+
+    def __init__(self, controller_factory, bot_factories, names, max_invalid=10):
+        self.controller_factory = controller_factory
+        self.bot_factories = bot_factories
+        self.names = names
+        self.max_invalid = max_invalid
+
+    def play(self, seed):
+        rng = random.Random(seed)
+        controller = self.controller_factory(rng.getrandbits(32))
+        bots = [factory(name, random.Random(rng.getrandbits(32)))
+                for factory, name in zip(self.bot_factories, self.names)]
+        for bot in bots:
+            controller.register(bot.name)
+        for bot, goal in zip(bots, ['north', 'south']):
+            bot.game_started(controller, goal)
+
+        moves = 0
+        invalid = 0
+        consecutive_invalid = 0
+        winner, reason = None, None
+        start = time.time()
+        while True:
+            active = controller.active_player
+            try:
+                action = bots[active].play(controller)
+            except Exception:
+                # only the bot's own move is guarded, harness and controller errors propagate
+                self.log.failure('Bot {name} crashed', name=self.names[active])
+                winner, reason = self.names[(active + 1) % 2], 'opponent crashed'
+                controller.forfeit(reason)
+                break
+            result = controller.move(action)
+            inverted = False
+            if isinstance(result, tuple):
+                result, inverted = result
+            if not result.valid:
+                invalid += 1
+                consecutive_invalid += 1
+                if consecutive_invalid > self.max_invalid:
+                    winner, reason = self.names[(active + 1) % 2], 'too many invalid moves'
+                    controller.forfeit(reason)
+                    break
+                continue
+            consecutive_invalid = 0
+            moves += 1
+            if result.terminated:
+                winner, reason = result.winner, result.reason
+                break
+            for bot in bots:
+                if inverted:
+                    bot.polarity_inverted()
+                bot.player_moved(self.names[active], action)
+
+        return MatchResult(self.names, getattr(controller, 'seed', None), winner, reason, moves, invalid,
+                           time.time() - start)
+
+
+class BatchReport(object):
+    def __init__(self, labels):
+        self.labels = labels
+        self.games = 0
+        self.wins = Counter()
+        self.first_mover_wins = 0
+        self.reasons = Counter()
+        self.moves = 0
+        self.invalid = 0
+        self.duration = 0.0
+
+    def add(self, result):
+        self.games += 1
+        self.moves += result.moves
+        self.invalid += result.invalid
+        self.duration += result.duration
+        self.reasons[result.reason] += 1
+        if result.winner is not None:
+            self.wins[result.winner] += 1
+            if result.winner == result.players[0]:
+                self.first_mover_wins += 1
+
+    def win_rate(self, label):
+        return float(self.wins[label]) / self.games if self.games else 0.0
+
+    def first_mover_rate(self):
+        return float(self.first_mover_wins) / self.games if self.games else 0.0
+
+    def average_length(self):
+        return float(self.moves) / self.games if self.games else 0.0
+
+    def moves_per_second(self):
+        return self.moves / self.duration if self.duration else 0.0
+
+    def __str__(self):
+        lines = ['{} games, {:.1f} moves per game, {:.0f} moves/s'.format(self.games, self.average_length(),
+                                                                         self.moves_per_second())]
+        for label in self.labels:
+            lines.append('  {}: {:.1%} wins'.format(label, self.win_rate(label)))
+        lines.append('  first mover: {:.1%} wins'.format(self.first_mover_rate()))
+        for reason, count in self.reasons.most_common():
+            lines.append('  {}: {}'.format(reason, count))
+        if self.invalid:
+            lines.append('  invalid moves: {}'.format(self.invalid))
+        return '\n'.join(lines)
+
+
+def run_batch(controller_factory, bots, labels, games, seed=0):
+    report = BatchReport(labels)
+    rng = random.Random(seed)
+    for game in range(games):
+        seats = [0, 1] if game % 2 == 0 else [1, 0]
+        match = Match(controller_factory, [bots[seat] for seat in seats], [labels[seat] for seat in seats])
+        report.add(match.play(rng.getrandbits(32)))
+    return report
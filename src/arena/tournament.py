@@ -0,0 +1,150 @@
+import csv
+import json
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from itertools import combinations
+
+from arena.bots import BOTS
+from arena.match import Match
+from hockey.compact_board import CompactBoardBuilder
+from hockey.controller import ControllerGentle
+from hockey2.controller_polarity import ControllerPolarity
+
+FIELDS = ['match', 'round', 'north', 'south', 'seed', 'winner', 'reason', 'moves', 'invalid', 'duration']
+
+
+def match_seed(seed, match_id):
+    return random.Random('{}:{}'.format(seed, match_id)).getrandbits(32)
+
+
+def play_match(config, spec):
+    size_x, size_y = config['size']
+    participants = config['participants']
+    if config['gentle']:
+        controller_factory = lambda seed: ControllerGentle(size_x, size_y, builder=CompactBoardBuilder, printer=None)
+    else:
+        controller_factory = lambda seed: ControllerPolarity(size_x, size_y, builder=CompactBoardBuilder,
+                                                             printer=None, seed=seed)
+    match = Match(controller_factory,
+                  [BOTS[participants[spec['north']]], BOTS[participants[spec['south']]]],
+                  [spec['north'], spec['south']])
+    result = match.play(spec['seed'])
+    record = dict(spec)
+    record.update(winner=result.winner, reason=result.reason, moves=result.moves, invalid=result.invalid,
+                  duration=round(result.duration, 6))
+    return record
+
+
+class ResultLog(object):
+    def __init__(self, path):
+        self.path = path
+        self.csv = path.endswith('.csv')
+
+    def read(self):
+        if not os.path.exists(self.path):
+            return []
+        self._truncate_torn_line()
+        with open(self.path) as f:
+            if self.csv:
+                return [self._from_csv(row) for row in csv.DictReader(f)]
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _truncate_torn_line(self):
+        # a run killed mid-write leaves a last line without its newline, drop it so the match is played again
+        with open(self.path, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b'\n'):
+                f.truncate(data.rfind(b'\n') + 1)
+
+    def open(self):
+        new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self.file = open(self.path, 'a')
+        if self.csv:
+            self.writer = csv.DictWriter(self.file, FIELDS)
+            if new:
+                self.writer.writeheader()
+
+    def write(self, record):
+        if self.csv:
+            self.writer.writerow(record)
+        else:
+            self.file.write(json.dumps(record, sort_keys=True) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def _from_csv(self, row):
+        for key in ['round', 'seed', 'moves', 'invalid']:
+            row[key] = int(row[key])
+        row['duration'] = float(row['duration'])
+        row['winner'] = row['winner'] or None
+        return row
+
+
+class Tournament(object):
+    def __init__(self, participants, games, seed=0, size=(15, 15), gentle=False, workers=None):
+        self.participants = participants
+        self.games = games
+        self.seed = seed
+        self.config = {'participants': participants, 'size': tuple(size), 'gentle': gentle}
+        self.workers = workers
+        self.results = {}
+
+    def run(self, log, swiss_rounds=None):
+        for record in log.read():
+            self.results[record['match']] = record
+        log.open()
+        try:
+            with ProcessPoolExecutor(self.workers) as executor:
+                if swiss_rounds is None:
+                    self._play(executor, log, self.round_robin())
+                else:
+                    for round_number in range(swiss_rounds):
+                        self._play(executor, log, self.swiss_round(round_number))
+        finally:
+            log.close()
+        return self.standings()
+
+    def round_robin(self):
+        for game in range(self.games):
+            for a, b in combinations(sorted(self.participants), 2):
+                north, south = (a, b) if game % 2 == 0 else (b, a)
+                yield self._spec('rr-{}-{}-{}'.format(a, b, game), 0, north, south)
+
+    def swiss_round(self, round_number):
+        # pair only on earlier rounds so that resuming from a complete log reproduces the same pairings
+        earlier = [record for record in self.results.values() if record['round'] < round_number]
+        scores = self.standings(earlier)
+        played = set(frozenset([record['north'], record['south']]) for record in earlier)
+        ranking = sorted(self.participants, key=lambda label: (-scores[label], label))
+        while len(ranking) > 1:
+            a = ranking.pop(0)
+            opponents = [label for label in ranking if frozenset([a, label]) not in played]
+            b = opponents[0] if opponents else ranking[0]
+            ranking.remove(b)
+            for game in range(self.games):
+                north, south = (a, b) if game % 2 == 0 else (b, a)
+                yield self._spec('sw-{}-{}-{}-{}'.format(round_number, a, b, game), round_number, north, south)
+
+    def standings(self, records=None):
+        scores = Counter(dict((label, 0) for label in self.participants))
+        for record in self.results.values() if records is None else records:
+            if record['winner'] is not None:
+                scores[record['winner']] += 1
+        return scores
+
+    def _spec(self, match_id, round_number, north, south):
+        return {'match': match_id, 'round': round_number, 'north': north, 'south': south,
+                'seed': match_seed(self.seed, match_id)}
+
+    def _play(self, executor, log, specs):
+        futures = [executor.submit(play_match, self.config, spec) for spec in specs
+                   if spec['match'] not in self.results]
+        for future in as_completed(futures):
+            record = future.result()
+            self.results[record['match']] = record
+            log.write(record)
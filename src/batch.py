@@ -0,0 +1,45 @@
+import argparse
+
+from arena.bots import BOTS
+from arena.match import run_batch
+from hockey.controller import ControllerGentle
+from hockey.compact_board import CompactBoardBuilder
+from hockey2.controller_polarity import ControllerPolarity
+from hockey2.game_archive import ArchiveWriter
+from hockey2.game_record import RecordWriter
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Play bots against each other without the server.')
+    parser.add_argument('bots', nargs=2, choices=sorted(BOTS))
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--size', type=int, nargs=2, default=(15, 15))
+    parser.add_argument('--gentle', action='store_true', help='play without power up and polarity inversion')
+    parser.add_argument('--record', help='append every game to this record file')
+    parser.add_argument('--archive', help='append every game to this archive directory')
+    return parser.parse_args()
+
+
+def controller_factory(args, printer=None):
+    size_x, size_y = args.size
+    if args.gentle:
+        return lambda seed: ControllerGentle(size_x, size_y, builder=CompactBoardBuilder, printer=printer)
+    return lambda seed: ControllerPolarity(size_x, size_y, builder=CompactBoardBuilder, printer=printer, seed=seed)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    labels = ['{}{}'.format(bot, seat) for seat, bot in enumerate(args.bots)]
+    recorder = None
+    if args.archive:
+        recorder = ArchiveWriter(args.archive)
+    if args.record:
+        recorder = RecordWriter(args.record, recorder)
+    printer = (lambda: recorder) if recorder is not None else None
+    report = run_batch(controller_factory(args, printer), [BOTS[bot] for bot in args.bots], labels, args.games,
+                       args.seed)
+    while recorder is not None:
+        recorder.close()
+        recorder = recorder.next_printer
+    print(report)
@@ -0,0 +1,34 @@
+import argparse
+
+from hockey2.game_archive import GameArchive
+from hockey2.game_record import RecordReader
+from search.opening_book import OpeningBook
+from search.opening_book import OpeningBookBuilder
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Build an opening book from recorded or archived games.')
+    parser.add_argument('book', help='book file to write')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--record', help='record file written by the server or batch.py --record')
+    source.add_argument('--archive', help='archive directory written by batch.py --archive')
+    parser.add_argument('--size', type=int, nargs=2, default=(15, 15), metavar=('X', 'Y'))
+    parser.add_argument('--plies', type=int, default=8, help='plies from the start covered by the book')
+    parser.add_argument('--min-games', type=int, default=2, help='games a move needs before it is trusted')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    builder = OpeningBookBuilder(args.size[0], args.size[1], args.plies, args.min_games)
+    if args.record:
+        reader = RecordReader(args.record)
+        for record in reader:
+            builder.add(record)
+        reader.close()
+    else:
+        for record in GameArchive(args.archive).records():
+            builder.add(record)
+    entries = builder.save(args.book)
+    book = OpeningBook(args.book)
+    print('{} positions over {} plies, {} slots'.format(entries, book.plies, len(book.table)))
@@ -1,24 +1,114 @@
+import argparse
+import json
 import random
+import sys
 
 from twisted.internet import protocol
 from twisted.internet import reactor
+from twisted.logger import FilteringLogObserver
+from twisted.logger import LogLevel
+from twisted.logger import LogLevelFilterPredicate
+from twisted.logger import Logger
+from twisted.logger import globalLogBeginner
+from twisted.logger import textFileLogObserver
 from twisted.protocols.basic import LineReceiver
 
 from hockey.action import Action
+from hockey.search_state import SearchState
+from search.alphabeta import AlphaBeta
+from search.mcts import MonteCarlo
+from search.opening_book import OpeningBook
 
 import re
 import numpy as np
 from itertools import product, chain
 
+# (row, column) offset to direction code
+DIRECTIONS = dict(((dy, dx), direction) for direction, (dx, dy) in enumerate(Action.delta))
+
+
+def adjacency(rows, columns):
+    neighbors = {}
+    inside = np.zeros((rows, columns, 8), dtype=bool)
+    for position in product(range(rows), range(columns)):
+        neighbors[position] = []
+        for edge, delta in Action.move.items():
+            dx, dy = delta
+            pos = position[0] + dy, position[1] + dx
+            if 0 <= pos[0] < rows and 0 <= pos[1] < columns:
+                neighbors[position].append((edge, Action.Number[edge], pos))
+                inside[position + (Action.Number[edge],)] = True
+    return neighbors, inside
+
+
+def shifted(grid, direction, fill):
+    # value of each dot's neighbor in `direction`, `fill` off the board
+    dx, dy = Action.delta[direction]
+    rows, columns = grid.shape
+    padded = np.full((rows + 2, columns + 2), fill, dtype=grid.dtype)
+    padded[1:-1, 1:-1] = grid
+    return padded[1 + dy:1 + dy + rows, 1 + dx:1 + dx + columns]
+
+
+# (kind, pattern, handler, argument parsers), tried in order
+SERVER_MESSAGES = (
+    ('size', r'board size is \((\d+), (\d+)\) - \d+', 'board_size', (int, int)),
+    ('ball', r'ball is at \((\d+), (\d+)\) - (\d+)', 'ball_at', (int, int, int)),
+    ('goal', r'your goal is (\w+) - \d+', 'goal_is', (str,)),
+    ('power_up', r'power up is at \((\d+), (\d+)\) - \d+', 'power_up_at', (int, int)),
+    ('polarity', r'polarity of the goal has been inverted - \d+', 'polarity_inverted', ()),
+    ('action', r'(.*) did go (.*) - (\d+)', 'player_moved', (str, Action.to_number, int)),
+    ('won', r'.* won a goal was made - \d+', 'game_ended', ()),
+    ('active', r'(.*) is active player', 'active_player_is', (str,)),
+    ('invalid', r'invalid move', 'invalid_move', ()),
+)
+SERVER_LINE = re.compile('|'.join('(?P<{}>{})'.format(kind, pattern) for kind, pattern, _, _ in SERVER_MESSAGES))
+HANDLERS = dict((kind, (handler, parsers)) for kind, _, handler, parsers in SERVER_MESSAGES)
+
+# json protocol events: kind -> (handler, event fields)
+EVENTS = {
+    'size': ('board_size', lambda event: event['size']),
+    'ball': ('ball_at', lambda event: event['position'] + [event['id']]),
+    'goal': ('goal_is', lambda event: [event['goal']]),
+    'power_up': ('power_up_at', lambda event: event['position']),
+    'inverted': ('polarity_inverted', lambda event: []),
+    'action': ('player_moved', lambda event: [event['player'], event['action'], event['id']]),
+    'end': ('game_ended', lambda event: []),
+    'active': ('active_player_is', lambda event: [event['player']]),
+    'invalid': ('invalid_move', lambda event: []),
+}
+
+
 class HockeyClient(LineReceiver, object):
+    adjacencies = {}
+    protocol = 'text'
+    book = None
+    book_plies = 0
+    log = Logger()
+
     def __init__(self, name, debug):
         self.name = name
         self.debug = debug
 
-        # state
-        self.grid = np.zeros((15, 15))
-        self.edge_taken = np.zeros((15, 15, 15, 15))
-        self.blacklist = np.zeros((15, 15))
+        self.size_x = None
+        self.size_y = None
+        self.grid = None
+        self.blacklist = None
+        self.state = None
+
+    def board_size(self, size_x, size_y):
+        self.size_x = size_x
+        self.size_y = size_y
+        self.goal_x = int(round(size_x / 2.0) - 1)
+
+        # state, indexed by (row, column)
+        self.grid = np.zeros((size_y, size_x))
+        self.edge_taken = np.zeros((size_y, size_x, 8), dtype=np.uint8)
+        self.blacklist = np.zeros((size_y, size_x))
+
+        if (size_y, size_x) not in HockeyClient.adjacencies:
+            HockeyClient.adjacencies[(size_y, size_x)] = adjacency(size_y, size_x)
+        self.adjacency, self.inside = HockeyClient.adjacencies[(size_y, size_x)]
 
         self.ball_position = None
         self.goal = None
@@ -27,16 +117,18 @@ class HockeyClient(LineReceiver, object):
         self.powerup = False
 
         # horizontal borders
-        for i in range(14):
+        for i in range(size_x - 1):
             self.mark_edge_as_taken((0, i), (0, i + 1))
-            self.mark_edge_as_taken((14, i), (14, i + 1))
+            self.mark_edge_as_taken((size_y - 1, i), (size_y - 1, i + 1))
 
         # vertical borders
-        for j in range(14):
+        for j in range(size_y - 1):
             self.mark_edge_as_taken((j + 1, 0), (j, 0))
-            self.mark_edge_as_taken((j + 1, 14), (j, 14))
+            self.mark_edge_as_taken((j + 1, size_x - 1), (j, size_x - 1))
 
     def connectionMade(self):
+        if self.protocol == 'json':
+            self.sendLine('protocol json')
         self.sendLine(self.name)
 
     def sendLine(self, line):
@@ -46,63 +138,96 @@ class HockeyClient(LineReceiver, object):
         line = line.decode('UTF-8')
 
         if self.debug:
-            print('Server said:', line)
-            print(self.grid)
-            print(self.blacklist)
-
-        match = re.match(r'ball is at \((\d+), (\d+)\) - (\d+)', line)
-        if match:
-            pos = int(match.group(1)), int(match.group(2))
-            self.ball_position = pos
-            self.grid[pos] = int(match.group(3))
-            return
+            self.log.debug('Server said: {line}\n{client.grid}\n{client.blacklist}', line=line, client=self)
 
-        match = re.match(r'your goal is (\w+) - \d+', line)
-        if match:
-            if match.group(1) == 'north':
-                self.goal = 'north'
-                self.goal_position = (-1, 7) # go south
-            else:
-                self.goal = 'south'
-                self.goal_position = (15, 7) # go north
-            self.init_blacklist()
+        if self.protocol == 'json' and line.startswith('{'):
+            event = json.loads(line)
+            if event['kind'] in EVENTS:
+                handler, fields = EVENTS[event['kind']]
+                getattr(self, handler)(*fields(event))
             return
 
-        match = re.match(r'power up is at \((\d+), (\d+)\) - \d+', line)
-        if match:
-            x, y = int(match.group(1)), int(match.group(2))
-            self.powerup_position = y, x
-            self.init_blacklist()
+        match = SERVER_LINE.match(line)
+        if match is None:
             return
+        handler, parsers = HANDLERS[match.lastgroup]
+        first = match.lastindex + 1
+        getattr(self, handler)(*[parse(match.group(first + i)) for i, parse in enumerate(parsers)])
 
-        if re.match(r'polarity of the goal has been inverted - \d+', line):
-            self.goal = 'south' if self.goal == 'north' else 'north'
-            self.goal_position = 14 - self.goal_position[0], self.goal_position[1]
-            self.init_blacklist()
-            return
+    def active_player_is(self, player):
+        if player == self.name:
+            self.invalid_move()
 
-        match = re.match(r'(.*) did go (?:power )?(.*) - (\d+)', line)
-        if match:
-            dx, dy = Action.move[(match.group(2))]
-            new_ball_position = self.ball_position[0] + dy, self.ball_position[1] + dx
-            self.grid[new_ball_position] = int(match.group(3))
-            self.mark_edge_as_taken(self.ball_position, new_ball_position)
-            self.ball_position = new_ball_position
-            if new_ball_position == self.powerup_position:
-                self.powerup_position = None
-                self.init_blacklist()
-                if self.name == match.group(1):
-                    self.powerup = True
-            return
+    def invalid_move(self):
+        move = self.choose_move()
+        if self.debug:
+            self.log.debug('Playing {move}', move=move)
+        if self.protocol == 'json':
+            move = json.dumps({'action': Action.to_number(move)})
+        self.sendLine(move)
+
+    def choose_move(self):
+        if self.book is not None and self.plies < self.book_plies:
+            move = self.book.move(self.state)
+            if move is not None and move in self.state.moves():
+                return Action.from_number(move)
+        return self.play_game()
+
+    def game_ended(self):
+        pass # fin de la partie
+
+    def ball_at(self, x, y, msgid):
+        if self.size_x is None:
+            # servers that do not announce the size always center the ball
+            self.board_size(2 * x + 1, 2 * y + 1)
+        pos = y, x
+        self.ball_position = pos
+        self.grid[pos] = msgid
+        # compact mirror of the game, shared by the search strategies and the opening book
+        self.state = SearchState.initial(self.size_x, self.size_y)
+        self.plies = 0
+
+    def goal_is(self, goal):
+        if goal == 'north':
+            self.goal = 'north'
+            self.goal_position = (-1, self.goal_x) # go south
+        else:
+            self.goal = 'south'
+            self.goal_position = (self.size_y, self.goal_x) # go north
+        self.init_blacklist()
+
+    def power_up_at(self, x, y):
+        self.powerup_position = y, x
+        self.state.power_up_position = self.state.index(x, y)
+        self.init_blacklist()
+
+    def polarity_inverted(self):
+        self.goal = 'south' if self.goal == 'north' else 'north'
+        self.goal_position = self.size_y - 1 - self.goal_position[0], self.goal_position[1]
+        self.state.invert_polarity()
+        self.init_blacklist()
+
+    def player_moved(self, player, action, msgid):
+        dx, dy = Action.delta[Action.direction(action)]
+        new_ball_position = self.ball_position[0] + dy, self.ball_position[1] + dx
+        self.grid[new_ball_position] = msgid
+        self.mark_edge_as_taken(self.ball_position, new_ball_position)
+        self.ball_position = new_ball_position
+        self.state.make(action)
+        self.plies += 1
+        if new_ball_position == self.powerup_position:
+            self.powerup_position = None
+            self.init_blacklist()
+            if self.name == player:
+                self.powerup = True
 
-        if re.match(r'.* won a goal was made - \d+', line):
-            return # fin de la partie
+    def init_blacklist(self):
+        pass
 
-        if '{} is active player'.format(self.name) in line or 'invalid move' in line:
-            move = self.play_game()
-            # TODO Debug this shit
-            # print(move)
-            self.sendLine(self.play_game())
+    def mark_edge_as_taken(self, a, b):
+        direction = DIRECTIONS[b[0] - a[0], b[1] - a[1]]
+        self.edge_taken[a + (direction,)] = True
+        self.edge_taken[b + (Action.opposite[direction],)] = True
 
 def manhattan(a, b, c=None):
     if c:
@@ -112,44 +237,41 @@ def manhattan(a, b, c=None):
 
 class RandomHockeyClient(HockeyClient):
     def neighborhood(self, position):
-        for edge, delta in Action.move.items():
-            dx, dy = delta
-            pos = position[0] + dy, position[1] + dx
-            if 0 <= pos[0] <= 14 and 0 <= pos[1] <= 14:
-                if not self.edge_taken[position][pos]:
-                    yield edge, pos
+        for edge, direction, pos in self.adjacency[position]:
+            if not self.edge_taken[position + (direction,)]:
+                yield edge, pos
 
     def bouncing_neighborhood(self, pos):
         return [neighbor for neighbor in self.neighborhood(pos) if
                 self.grid[neighbor[1]] and not self.blacklist[neighbor[1]]]
 
     def init_blacklist(self):
-        self.blacklist = np.zeros((15, 15))
+        last_x, last_y, goal_x = self.size_x - 1, self.size_y - 1, self.goal_x
+        self.blacklist = np.zeros((self.size_y, self.size_x))
+
+        self.borders = np.zeros((self.size_y, self.size_x), dtype=bool)
+        self.borders[1:last_y, 0] = True
+        self.borders[1:last_y, last_x] = True
+        for x in chain(range(1, goal_x - 2), range(goal_x + 2, last_x)):
+            self.borders[0, x] = True
+            self.borders[last_y, x] = True
 
         # center
-        self.blacklist[7, 7] = True
+        self.blacklist[(self.size_y - 1) // 2, (self.size_x - 1) // 2] = True
 
         # corners
         self.blacklist[0, 0] = True
-        self.blacklist[0, 14] = True
-        self.blacklist[14, 0] = True
-        self.blacklist[14, 14] = True
+        self.blacklist[0, last_x] = True
+        self.blacklist[last_y, 0] = True
+        self.blacklist[last_y, last_x] = True
 
         if self.goal == 'north':
             # protect south goal
-            self.blacklist[14, 7] = True
-            self.blacklist[13, 5] = True
-            self.blacklist[13, 6] = True
-            self.blacklist[13, 7] = True
-            self.blacklist[13, 8] = True
-            self.blacklist[13, 9] = True
+            self.blacklist[last_y, goal_x] = True
+            self.blacklist[last_y - 1, goal_x - 2:goal_x + 3] = True
         else:
-            self.blacklist[0, 7] = True
-            self.blacklist[1, 5] = True
-            self.blacklist[1, 6] = True
-            self.blacklist[1, 7] = True
-            self.blacklist[1, 8] = True
-            self.blacklist[1, 9] = True
+            self.blacklist[0, goal_x] = True
+            self.blacklist[1, goal_x - 2:goal_x + 3] = True
 
         # powerup surroundings
         if self.powerup_position:
@@ -157,137 +279,111 @@ class RandomHockeyClient(HockeyClient):
                 if self.grid[pos] == 0:
                     self.blacklist[pos] = True
 
-    def update_blacklist(self):
-        for y in range(1, 14):
-            if len(list(self.neighborhood((y, 0)))) == 1:
-                self.blacklist[(y, 0)] = True
-            if len(list(self.neighborhood((y, 14)))) == 1:
-                self.blacklist[(y, 14)] = True
-        for x in chain(range(1, 5), range(9, 14)):
-            if len(list(self.neighborhood((0, x)))) == 1:
-                self.blacklist[(0, x)] = True
-            if len(list(self.neighborhood((14, x)))) == 1:
-                self.blacklist[(14, x)] = True
-
-        for pos in zip(*np.nonzero(self.blacklist)):
-            for accessible in [u for u_edge, u in self.neighborhood(pos) if not self.blacklist[u]]:
-                self.spooke(accessible, pos)
-
-    def find_path_recur(self, u, direc, v, i):
-        reachable = []
-
-        for w in [w for edge_w, w in self.neighborhood(u) if w not in v and not self.blacklist[w]]:
-            if self.grid[w] != 0:
-                reachable += (w, direc, i + 1)
-            else:
-                reachable += self.find_path_recur(w, direc, v + [u], i + 1)
+    def free_edges(self):
+        return self.inside & (self.edge_taken == 0)
 
-        return reachable
-
-    def find_path(self, vertex):
-        reachable = []
-
-        for accessible in [u for u_edge, u in self.neighborhood(vertex) if not self.blacklist[u]]:
-            if self.grid[accessible] == 0:
-                reachable += (accessible, accessible, 1)
-            else:
-                reachable += self.find_path_recur(accessible, accessible, [vertex], 1)
-
-        return reachable
-
-    def mark_edge_as_taken(self, a, b):
-        self.edge_taken[a][b] = True
-        self.edge_taken[b][a] = True
-
-    def spooke(self, u, v):
-        a = [w for edge_w, w in self.neighborhood(u) if v != w and not self.blacklist[w]]
-
-        if len(a) == 0:
-            self.blacklist[u] = True
-        elif len(a) == 1:
-            self.blacklist[u] = True
-            self.spooke(a[0], u)
-        else:
-            pass # there is a way out!
+    def update_blacklist(self):
+        free = self.free_edges()
+
+        # border dots with a single way out
+        self.blacklist[self.borders & (free.sum(axis=2) == 1)] = True
+
+        # a dot next to a dead end that has at most one other way out is a dead end too
+        blacklist = self.blacklist != 0
+        while True:
+            open_neighbors = np.zeros(blacklist.shape, dtype=np.uint8)
+            closed_neighbors = np.zeros(blacklist.shape, dtype=bool)
+            for direction in range(8):
+                neighbor = shifted(blacklist, direction, True)
+                open_neighbors += free[:, :, direction] & ~neighbor
+                closed_neighbors |= free[:, :, direction] & neighbor
+            dead_ends = closed_neighbors & (open_neighbors <= 1) & ~blacklist
+            if not dead_ends.any():
+                break
+            blacklist |= dead_ends
+        self.blacklist[blacklist] = True
 
     def play_game(self):
+        row, column = self.ball_position
+        last_y, goal_x = self.size_y - 1, self.goal_x
+
         # Use the powerup if near the goal
-        if self.powerup and self.ball_position[0] == 2 and self.goal == 'north':
-            # if self.ball_position[1] == 4:
+        if self.powerup and row == 2 and self.goal == 'north':
+            # if column == goal_x - 3:
                 # return 'power north east'
-            if self.ball_position[1] == 5:
+            if column == goal_x - 2:
                 return 'power north east'
-            if self.ball_position[1] == 6:
+            if column == goal_x - 1:
                 return 'power north'
-            if self.ball_position[1] == 7:
+            if column == goal_x:
                 return 'power north'
-            if self.ball_position[1] == 8:
+            if column == goal_x + 1:
                 return 'power north'
-            if self.ball_position[1] == 9:
+            if column == goal_x + 2:
                 return 'power north west'
-            # if self.ball_position[1] == 10:
+            # if column == goal_x + 3:
                 # return 'power '
 
-        if self.powerup and self.ball_position[0] == 13 and self.goal == 'south':
-            # if self.ball_position[1] == 4:
+        if self.powerup and row == last_y - 1 and self.goal == 'south':
+            # if column == goal_x - 3:
                 # return 'power south east'
-            if self.ball_position[1] == 5:
+            if column == goal_x - 2:
                 return 'power south east'
-            if self.ball_position[1] == 6:
+            if column == goal_x - 1:
                 return 'power south'
-            if self.ball_position[1] == 7:
+            if column == goal_x:
                 return 'power south'
-            if self.ball_position[1] == 8:
+            if column == goal_x + 1:
                 return 'power south'
-            if self.ball_position[1] == 9:
+            if column == goal_x + 2:
                 return 'power south west'
-            # if self.ball_position[1] == 10:
+            # if column == goal_x + 3:
                 # return 'power south west'
 
-        if self.ball_position[0] == 0 and self.goal == 'north':
-            if self.ball_position[1] == 6:
+        if row == 0 and self.goal == 'north':
+            if column == goal_x - 1:
                 return 'north east'
-            if self.ball_position[1] == 7:
+            if column == goal_x:
                 return 'north'
-            if self.ball_position[1] == 8:
+            if column == goal_x + 1:
                 return 'north west'
 
-        if self.ball_position[0] == 14 and self.goal == 'south':
-            if self.ball_position[1] == 6:
+        if row == last_y and self.goal == 'south':
+            if column == goal_x - 1:
                 return 'south east'
-            if self.ball_position[1] == 7:
+            if column == goal_x:
                 return 'south'
-            if self.ball_position[1] == 8:
+            if column == goal_x + 1:
                 return 'south west'
 
         # rebound in goal
-        if self.ball_position[0] == 1 and self.goal == 'north':
-            if self.ball_position[1] == 5:
+        if row == 1 and self.goal == 'north':
+            if column == goal_x - 2:
                 return 'north east'
-            if self.ball_position[1] == 6:
+            if column == goal_x - 1:
                 return 'north'
 
-            if self.ball_position[1] == 7:
+            if column == goal_x:
                 return 'north west'  # or north east, same thing
 
-            if self.ball_position[1] == 8:
+            if column == goal_x + 1:
                 return 'north'
-            if self.ball_position[1] == 9:
+            if column == goal_x + 2:
                 return 'north west'
 
         # rebound in goal
-        if self.ball_position[0] == 13 and self.goal == 'south':
-            if self.ball_position[1] == 5:
+        if row == last_y - 1 and self.goal == 'south':
+            if column == goal_x - 2:
                 return 'south east'
-            if self.ball_position[1] == 6:
+            if column == goal_x - 1:
                 return 'south'
 
-            if self.ball_position[1] == 7:
+            if column == goal_x:
                 return 'south west'  # or south east, same thing
 
-            if self.ball_position[1] == 8:
+            if column == goal_x + 1:
                 return 'south'
-            if self.ball_position[1] == 9:
+            if column == goal_x + 2:
                 return 'south west'
 
         self.update_blacklist()
@@ -324,27 +420,108 @@ class RandomHockeyClient(HockeyClient):
             else:
                 return valid_choice[0]
 
+class SearchHockeyClient(HockeyClient):
+    def __init__(self, name, debug, search):
+        super(SearchHockeyClient, self).__init__(name, debug)
+        self.search = search
+
+    def play_game(self):
+        move = self.search.best_move(self.state)
+        if self.debug:
+            self.report()
+        return Action.from_number(move)
+
+
+class AlphaBetaHockeyClient(SearchHockeyClient):
+    def __init__(self, name, debug, time_budget=1.0, max_depth=64):
+        super(AlphaBetaHockeyClient, self).__init__(name, debug, AlphaBeta(time_budget, max_depth))
+
+    def report(self):
+        self.log.debug('Searched {search.nodes} nodes, depth {search.depth}', search=self.search)
+
+
+class MctsHockeyClient(SearchHockeyClient):
+    def __init__(self, name, debug, time_budget=1.0, workers=1, iterations=None, rng=None):
+        super(MctsHockeyClient, self).__init__(name, debug, MonteCarlo(time_budget, workers, iterations=iterations,
+                                                                       rng=rng))
+
+    def report(self):
+        self.log.debug('Played {search.rollouts} rollouts, {search.rollouts_per_second:.0f} rollouts/sec',
+                       search=self.search)
+
+    def connectionLost(self, reason):
+        super(MctsHockeyClient, self).connectionLost(reason)
+        self.search.close()
+
+
+CLIENTS = {
+    'random': RandomHockeyClient,
+    'alphabeta': AlphaBetaHockeyClient,
+    'mcts': MctsHockeyClient,
+}
+
+
 class ClientFactory(protocol.ClientFactory):
-    def __init__(self, name, debug):
+    log = Logger()
+
+    def __init__(self, name, debug, client_class=RandomHockeyClient, protocol='text', book=None, book_plies=0,
+                 **options):
         self.name = name
         self.debug = debug
+        self.client_class = client_class
+        self.protocol = protocol
+        self.book = book
+        self.book_plies = book_plies
+        self.options = options
 
     def buildProtocol(self, addr):
-        return RandomHockeyClient(self.name, self.debug)
+        client = self.client_class(self.name, self.debug, **self.options)
+        client.protocol = self.protocol
+        client.book = self.book
+        client.book_plies = self.book_plies
+        return client
 
     def clientConnectionFailed(self, connector, reason):
         if self.debug:
-            print("Connection failed - goodbye!")
+            self.log.info('Connection failed - goodbye!')
         reactor.stop()
 
     def clientConnectionLost(self, connector, reason):
         if self.debug:
-            print("Connection lost - goodbye!")
+            self.log.info('Connection lost - goodbye!')
         reactor.stop()
 
 
-name = "Kek{}".format(random.randint(0, 999))
-
-f = ClientFactory(name, debug=False)
-reactor.connectTCP("localhost", 8023, f)
-reactor.run()
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Connect a bot to the hockey server.')
+    parser.add_argument('strategy', nargs='?', default='random', choices=sorted(CLIENTS))
+    parser.add_argument('--time', type=float, default=1.0, help='seconds per move for search strategies')
+    parser.add_argument('--debug', action='store_true', help='log every server line and move')
+    parser.add_argument('--json', action='store_true', help='speak the json protocol with the server')
+    parser.add_argument('--workers', type=int, default=1, help='rollout processes for the mcts strategy')
+    parser.add_argument('--depth', type=int, help='fixed alphabeta depth instead of --time')
+    parser.add_argument('--iterations', type=int, help='fixed mcts rollouts per worker instead of --time')
+    parser.add_argument('--book', help='opening book consulted before the strategy')
+    parser.add_argument('--book-plies', type=int, help='plies to play from the book, defaults to its depth')
+    args = parser.parse_args()
+    name = "Kek{}".format(random.randint(0, 999))
+
+    options = {}
+    if args.strategy in ('alphabeta', 'mcts'):
+        options['time_budget'] = args.time
+    if args.strategy == 'alphabeta' and args.depth is not None:
+        options.update(time_budget=None, max_depth=args.depth)
+    if args.strategy == 'mcts':
+        options['workers'] = args.workers
+        options['iterations'] = args.iterations
+    if args.debug:
+        observer = textFileLogObserver(sys.stdout)
+        globalLogBeginner.beginLoggingTo([FilteringLogObserver(observer, [LogLevelFilterPredicate(LogLevel.debug)])])
+
+    book = OpeningBook(args.book) if args.book else None
+    book_plies = args.book_plies if args.book_plies is not None else book.plies if book else 0
+
+    f = ClientFactory(name, debug=args.debug, client_class=CLIENTS[args.strategy],
+                      protocol='json' if args.json else 'text', book=book, book_plies=book_plies, **options)
+    reactor.connectTCP("localhost", 8023, f)
+    reactor.run()
@@ -5,33 +5,48 @@ class Action(object):
 
     @staticmethod
     def to_number(action):
-        return list(Action.Name.values()).index(action)
+        return Action.Number[action]
 
-    NORTH = 'north'
-    NORTH_EAST = 'north east'
-    EAST = 'east'
-    SOUTH_EAST = 'south east'
-    SOUTH = 'south'
-    SOUTH_WEST = 'south west'
-    WEST = 'west'
-    NORTH_WEST = 'north west'
-    move = {
-        NORTH: (0, -1),
-        NORTH_EAST: (1, -1),
-        EAST: (1, 0),
-        SOUTH_EAST: (1, 1),
-        SOUTH: (0, 1),
-        SOUTH_WEST: (-1, 1),
-        WEST: (-1, 0),
-        NORTH_WEST: (-1, -1),
-    }
+    @staticmethod
+    def is_power(number):
+        return number & Action.POWER != 0
+
+    @staticmethod
+    def direction(number):
+        return number & ~Action.POWER
+
+    NORTH = 0
+    NORTH_EAST = 1
+    EAST = 2
+    SOUTH_EAST = 3
+    SOUTH = 4
+    SOUTH_WEST = 5
+    WEST = 6
+    NORTH_WEST = 7
+    POWER = 8
     Name = {
-        0: NORTH,
-        1: NORTH_EAST,
-        2: EAST,
-        3: SOUTH_EAST,
-        4: SOUTH,
-        5: SOUTH_WEST,
-        6: WEST,
-        7: NORTH_WEST,
+        NORTH: 'north',
+        NORTH_EAST: 'north east',
+        EAST: 'east',
+        SOUTH_EAST: 'south east',
+        SOUTH: 'south',
+        SOUTH_WEST: 'south west',
+        WEST: 'west',
+        NORTH_WEST: 'north west',
     }
+    delta = (
+        (0, -1),
+        (1, -1),
+        (1, 0),
+        (1, 1),
+        (0, 1),
+        (-1, 1),
+        (-1, 0),
+        (-1, -1),
+    )
+    opposite = (SOUTH, SOUTH_WEST, WEST, NORTH_WEST, NORTH, NORTH_EAST, EAST, SOUTH_EAST)
+    move = dict(zip(Name.values(), delta))
+
+
+Action.Name.update((number | Action.POWER, 'power {}'.format(name)) for number, name in list(Action.Name.items()))
+Action.Number = dict((name, number) for number, name in Action.Name.items())
@@ -0,0 +1,41 @@
+import copy
+
+
+class Board(object):
+    def __init__(self, dots, size_x, size_y):
+        self.dots = dots
+        self.size_x = size_x
+        self.size_y = size_y
+
+    def has_dot(self, x, y):
+        return x in self.dots and y in self.dots[x]
+
+    def is_taken(self, x, y, action):
+        return self.dots[x][y]['actions'][action]
+
+    def take(self, x, y, action):
+        self.dots[x][y]['actions'][action] = True
+
+    def is_bounce(self, x, y):
+        return self.dots[x][y]['bounce']
+
+    def set_bounce(self, x, y):
+        self.dots[x][y]['bounce'] = True
+
+    def is_goal(self, x, y):
+        return self.dots[x][y]['is_goal']
+
+    def possible_actions(self, x, y):
+        place = self.dots[x][y]['actions']
+        return [action for action in place if not place[action]]
+
+    def edges(self):
+        for x in sorted(self.dots.keys()):
+            for y in sorted(self.dots[x].keys()):
+                actions = self.dots[x][y]['actions']
+                for action in sorted(actions.keys()):
+                    if actions[action] is True:
+                        yield x, y, action
+
+    def copy(self):
+        return Board(copy.deepcopy(self.dots), self.size_x, self.size_y)
@@ -1,9 +1,14 @@
 from copy import copy
 
 from hockey.action import Action
+from hockey.board import Board
 
 
 class BoardBuilder(object):
+    @staticmethod
+    def board(size_x, size_y):
+        return Board(BoardBuilder.init(size_x, size_y), size_x, size_y)
+
     @staticmethod
     def init(size_x, size_y):
         dots = {}
@@ -7,6 +7,7 @@ from PIL import Image
 from PIL import ImageDraw
 
 from hockey.action import Action
+from hockey.gif_writer import GifWriter
 
 GREEN = (0, 255, 0)
 RED = (255, 0, 0)
@@ -15,44 +16,56 @@ BLACK = (0, 0, 0)
 
 class BoardPrinter(object):
     offset = 20
+    # source pixels around a new line whose scaled value may change
+    margin = 3
+    animated = True
+
+    def game_ended(self, controller):
+        if self.animated:
+            self.print_gif(controller)
+        else:
+            self.print_game(controller)
 
     def print_game(self, controller, size=(800, 600)):
         im = self._draw_initial_board(controller)
-        draw = ImageDraw.Draw(im)
-
-        actions = controller.actions
-        draw.text((15, 0), controller.players[0], GREEN)
-        draw.text((15, im.height-10), controller.players[1], RED)
-        image_list = [im]
-
-        for source, player, action in actions:
-            source = tuple([i + self.offset for i in self._in_game_position_to_img(source)])
-            destination = self._get_destination_from_action(action, source)
-            color = self._color(player)
-            draw.line((source, destination), color)
-            image_list.append(im.resize(size).copy())
+        for _ in self._draw_actions(im, controller):
+            pass
 
-        image_list[-1].resize(size).save(self._get_filename_png(controller.players))
+        im.resize(size).save(self._get_filename_png(controller.players))
 
     def print_gif(self, controller, size=(800, 600)):
         im = self._draw_initial_board(controller)
+        with open(self._get_filename_gif(controller.players), 'wb') as fp:
+            writer = GifWriter(fp)
+            writer.add_frame(im.resize(size))
+            for line in self._draw_actions(im, controller):
+                box = self._scaled_box(line, im.size, size)
+                frame = im.resize((box[2] - box[0], box[3] - box[1]), box=self._source_box(box, im.size, size))
+                writer.add_frame(frame, box[:2])
+            writer.close()
+
+    def _draw_actions(self, im, controller):
         draw = ImageDraw.Draw(im)
-        actions = controller.actions
-        image_list = []
-        draw.text((15, 0), controller.players[0], GREEN)
-        draw.text((15, im.height-10), controller.players[1], RED)
-
-        for source, player, action in actions:
+        for source, player, action in controller.actions:
             source = tuple([i + self.offset for i in self._in_game_position_to_img(source)])
             destination = self._get_destination_from_action(action, source)
             color = self._color(player)
             draw.line((source, destination), color)
-            image_list.append(im.resize(size).copy())
-
-        im.resize(size).save(self._get_filename_gif(controller.players), save_all=True,
-                             append_images=image_list,
-                             optimize=False,
-                             loop=0)
+            yield source, destination
+
+    def _scaled_box(self, line, source_size, size):
+        (x0, y0), (x1, y1) = line
+        left = max(min(x0, x1) - self.margin, 0)
+        top = max(min(y0, y1) - self.margin, 0)
+        right = min(max(x0, x1) + 1 + self.margin, source_size[0])
+        bottom = min(max(y0, y1) + 1 + self.margin, source_size[1])
+        return (left * size[0] // source_size[0], top * size[1] // source_size[1],
+                -(-right * size[0] // source_size[0]), -(-bottom * size[1] // source_size[1]))
+
+    def _source_box(self, box, source_size, size):
+        scale_x = float(source_size[0]) / size[0]
+        scale_y = float(source_size[1]) / size[1]
+        return box[0] * scale_x, box[1] * scale_y, box[2] * scale_x, box[3] * scale_y
 
     def _get_filename_png(self, players):
         dir_path = os.path.dirname(os.path.realpath(__file__))
@@ -69,13 +82,15 @@ class BoardPrinter(object):
         return filename
 
     def _draw_initial_board(self, controller):
-        dots = controller.initial_dots
-        width = (len(dots) + 3) * 10
-        height = (max([len(dots[x]) for x in range(len(dots))]) + 1) * 10
+        board = controller.initial_board
+        width = (board.size_x + 3) * 10
+        height = (board.size_y + 3) * 10
         im = Image.new("RGB", (width, height), (255, 255, 255))
         draw = ImageDraw.Draw(im)
-        self._draw_outline(dots, draw)
+        self._draw_outline(board, draw)
         self._draw_cardinal(draw, height, width)
+        draw.text((15, 0), controller.players[0], GREEN)
+        draw.text((15, height - 10), controller.players[1], RED)
         return im
 
     def _draw_cardinal(self, draw, height, width):
@@ -87,21 +102,14 @@ class BoardPrinter(object):
     def _in_game_position_to_img(self, position):
         return position[0] * 10, position[1] * 10
 
-    def _draw_outline(self, dots, draw):
-        for x in sorted(dots.keys()):
-            for y in sorted(dots[x].keys()):
-                actions = dots[x][y]['actions']
-                keys = sorted(actions.keys())
-                for key in keys:
-                    action = key
-                    value = actions[key]
-                    if value is True:
-                        source = tuple([i + self.offset for i in self._in_game_position_to_img((x, y))])
-                        destination = self._get_destination_from_action(action, source)
-                        draw.line((source, destination), BLACK)
+    def _draw_outline(self, board, draw):
+        for x, y, action in board.edges():
+            source = tuple([i + self.offset for i in self._in_game_position_to_img((x, y))])
+            destination = self._get_destination_from_action(action, source)
+            draw.line((source, destination), BLACK)
 
     def _get_destination_from_action(self, action, source):
-        move = list(map(lambda x: x * 10, Action.move[action]))
+        move = list(map(lambda x: x * 10, Action.delta[action]))
         destination = source[0] + move[0], source[1] + move[1]
         return destination
 
@@ -119,3 +127,7 @@ class BoardPrinterCurrent(BoardPrinter):
         dir_path = os.path.dirname(os.path.realpath(__file__))
         filename = "{}/../../test/output/test-{}-{}VS{}.gif".format(dir_path, 'current', players[0], players[1])
         return filename
+
+
+class BoardPrinterFinal(BoardPrinterCurrent):
+    animated = False
@@ -0,0 +1,86 @@
+from array import array
+
+from hockey.board_builder import BoardBuilder
+
+POSSIBLE_ACTIONS = [tuple(action for action in range(8) if not mask & (1 << action)) for mask in range(256)]
+
+
+# Dots are stored column by column in flat buffers, with one extra row above and below the field
+# for the goals: `masks` holds one bit per taken action, `bounce`, `goal` and `present` one byte per dot.
+class CompactBoard(object):
+    def __init__(self, size_x, size_y, masks, bounce, goal, present):
+        self.size_x = size_x
+        self.size_y = size_y
+        self.stride = size_y + 2
+        self.masks = masks
+        self.bounce = bounce
+        self.goal = goal
+        self.present = present
+
+    def index(self, x, y):
+        return x * self.stride + y + 1
+
+    def has_dot(self, x, y):
+        if 0 <= x < self.size_x and -1 <= y <= self.size_y:
+            return self.present[self.index(x, y)] == 1
+        return False
+
+    def is_taken(self, x, y, action):
+        return self.masks[self.index(x, y)] & (1 << action) != 0
+
+    def take(self, x, y, action):
+        self.masks[self.index(x, y)] |= 1 << action
+
+    def is_bounce(self, x, y):
+        return self.bounce[self.index(x, y)] == 1
+
+    def set_bounce(self, x, y):
+        self.bounce[self.index(x, y)] = 1
+
+    def is_goal(self, x, y):
+        return self.goal[self.index(x, y)] == 1
+
+    def possible_actions(self, x, y):
+        return list(POSSIBLE_ACTIONS[self.masks[self.index(x, y)]])
+
+    def edges(self):
+        for x in range(self.size_x):
+            for y in range(-1, self.size_y + 1):
+                index = self.index(x, y)
+                if self.present[index]:
+                    mask = self.masks[index]
+                    for action in range(8):
+                        if mask & (1 << action):
+                            yield x, y, action
+
+    def copy(self):
+        return CompactBoard(self.size_x, self.size_y, array('B', self.masks), bytearray(self.bounce),
+                            bytearray(self.goal), bytearray(self.present))
+
+
+class CompactBoardBuilder(object):
+    templates = {}
+
+    @staticmethod
+    def board(size_x, size_y):
+        key = size_x, size_y
+        if key not in CompactBoardBuilder.templates:
+            CompactBoardBuilder.templates[key] = CompactBoardBuilder.from_board(BoardBuilder.board(size_x, size_y))
+        return CompactBoardBuilder.templates[key].copy()
+
+    @staticmethod
+    def from_board(board):
+        size_x, size_y = board.size_x, board.size_y
+        length = size_x * (size_y + 2)
+        compact = CompactBoard(size_x, size_y, array('B', [0]) * length, bytearray(length), bytearray(length),
+                               bytearray(length))
+        for x in range(size_x):
+            for y in range(-1, size_y + 1):
+                if board.has_dot(x, y):
+                    index = compact.index(x, y)
+                    compact.present[index] = 1
+                    compact.bounce[index] = 1 if board.is_bounce(x, y) else 0
+                    compact.goal[index] = 1 if board.is_goal(x, y) else 0
+        for x, y, action in board.edges():
+            compact.take(x, y, action)
+        return compact
@@ -1,4 +1,3 @@
-import copy
 import math
 
 from hockey.action import Action
@@ -26,18 +25,18 @@ class RuleEnforcer(object):
 
     def _get_ball_destination(self, action):
         ball_x, ball_y = self.controller.ball
-        x_to, y_to = Action.move[action]
+        x_to, y_to = Action.delta[action]
         x = x_to + ball_x
         y = y_to + ball_y
         return x, y
 
     def _out_of_bound_move(self, action):
         x, y = self._get_ball_destination(action)
-        return x not in self.controller.dots or y not in self.controller.dots[x]
+        return not self.controller.board.has_dot(x, y)
 
     def _illegal_move(self, action):
         ball_x, ball_y = self.controller.ball
-        return self.controller.dots[ball_x][ball_y]['actions'][action]
+        return self.controller.board.is_taken(ball_x, ball_y, action)
 
 
 class NoRuleEnforcerFound(RuleEnforcer):
@@ -68,16 +67,17 @@ class ApplyLegalMove(RuleEnforcer):
         self.controller.actions.append((self.controller.ball, self.controller.active_player, action))
         ball_x, ball_y = self.controller.ball
         x, y = self._get_ball_destination(action)
-        if not self.controller.dots[x][y]['bounce']:
+        board = self.controller.board
+        if not board.is_bounce(x, y):
             self.controller._switch_player()
 
         self.controller.ball = (x, y)
 
-        self.controller.dots[ball_x][ball_y]['actions'][action] = True
-        self.controller.dots[x][y]['actions'][self._opposite_action(action)] = True
+        board.take(ball_x, ball_y, action)
+        board.take(x, y, self._opposite_action(action))
 
-        self.controller.dots[x][y]['bounce'] = True
-        if self.controller.dots[x][y]['is_goal']:
+        board.set_bounce(x, y)
+        if board.is_goal(x, y):
             result = ActionResults(self.controller.active_player_name(), terminated=True, reason="a goal was made")
         else:
             result = ActionResults(self.controller.active_player_name(), terminated=False)
@@ -88,7 +88,7 @@ class ApplyLegalMove(RuleEnforcer):
         return result
 
     def _opposite_action(self, action):
-        return Action.from_number((Action.to_number(action) + 4) % 8)
+        return Action.opposite[action]
 
 
 class ApplyLegalMoveGently(ApplyLegalMove):
@@ -105,13 +105,14 @@ class Controller(object):
         self.size_x = size_x
         self.size_y = size_y
         self.goal_by_player = (-1, self.size_y)
-        self.dots = builder.init(self.size_x, self.size_y)
-        self.initial_dots = copy.deepcopy(self.dots)
-        self.dots[self.ball[0]][self.ball[1]]['bounce'] = True
+        self.board = builder.board(self.size_x, self.size_y)
+        self.initial_board = self.board.copy()
+        self.board.set_bounce(self.ball[0], self.ball[1])
         self.players = []
         self.active_player = 0
         self.terminated = False
-        self.printer = printer()
+        self.result = None
+        self.printer = printer() if printer is not None else None
 
         next_rule = self.rule()
 
@@ -135,15 +136,27 @@ class Controller(object):
         id = (self.active_player + 1) % 2
         action_result = self.rule_chain.process(action)
         if action_result.terminated:
-            self.printer.print_gif(self)
             if self.ball[1] == self.goal_by_player[0]:
                 action_result.winner = self.players[0]
             elif self.ball[1] == self.goal_by_player[1]:
                 action_result.winner = self.players[1]
             elif len(self.get_possible_actions(self.ball[0], self.ball[1])) == 0:
                 action_result.winner = self.players[id]
+            self._ended(action_result)
         return action_result
 
+    def forfeit(self, reason):
+        # the active player loses without moving, e.g. on timeout
+        winner = self.in_active_player_name()
+        self.terminated = True
+        self._ended(ActionResults(winner, terminated=True, winner=winner, reason=reason))
+
+    def _ended(self, action_result):
+        if self.result is None:
+            self.result = action_result
+            if self.printer is not None:
+                self.printer.game_ended(self)
+
     def _switch_player(self):
         self.active_player += 1
         self.active_player %= 2
@@ -152,9 +165,7 @@ class Controller(object):
         self.players.append(player_name)
 
     def get_possible_actions(self, x, y):
-        place = self.dots[x][y]['actions']
-
-        return [action for action in place if not place[action]]
+        return self.board.possible_actions(x, y)
 
 
 class ControllerGentle(Controller):
@@ -0,0 +1,26 @@
+from PIL import GifImagePlugin
+from PIL import Image
+
+
+class GifWriter(object):
+    def __init__(self, fp, loop=0):
+        self.fp = fp
+        self.loop = loop
+        self.frames = 0
+
+    def add_frame(self, im, offset=(0, 0)):
+        frame = im.convert('P', palette=Image.ADAPTIVE)
+        if self.frames == 0:
+            header, _ = GifImagePlugin.getheader(frame, info={'loop': self.loop})
+            self._write(header)
+            self._write(GifImagePlugin.getdata(frame))
+        else:
+            self._write(GifImagePlugin.getdata(frame, offset, include_color_table=True))
+        self.frames += 1
+
+    def close(self):
+        self.fp.write(b';')
+
+    def _write(self, chunks):
+        for chunk in chunks:
+            self.fp.write(chunk)
@@ -0,0 +1,124 @@
+import math
+
+from hockey.action import Action
+from hockey.compact_board import POSSIBLE_ACTIONS
+from hockey.compact_board import CompactBoardBuilder
+
+NONE = -1
+FULL = 0xFF
+
+
+class SearchState(object):
+    tables = {}
+
+    def __init__(self, board, ball):
+        self.size_x = board.size_x
+        self.size_y = board.size_y
+        self.stride = board.stride
+        self.goal_x = int(round(self.size_x / 2.0) - 1)
+        self.masks = bytearray(board.masks)
+        self.bounce = bytearray(board.bounce)
+        self.goal = bytes(board.goal)
+        if (self.size_x, self.size_y) not in SearchState.tables:
+            SearchState.tables[self.size_x, self.size_y] = self._tables(board)
+        self.targets, self.blocked = SearchState.tables[self.size_x, self.size_y]
+        self.ball = board.index(*ball)
+        self.active = 0
+        self.north_player = 0
+        self.power_up_position = NONE
+        self.power_up = NONE
+        self.winner = NONE
+
+    @staticmethod
+    def initial(size_x, size_y, power_up_position=None):
+        ball = int(math.ceil(size_x / 2.0) - 1), int(math.ceil(size_y / 2.0) - 1)
+        board = CompactBoardBuilder.board(size_x, size_y)
+        board.set_bounce(*ball)
+        state = SearchState(board, ball)
+        if power_up_position is not None:
+            state.power_up_position = state.index(*power_up_position)
+        return state
+
+    @staticmethod
+    def from_controller(controller):
+        state = SearchState(CompactBoardBuilder.from_board(controller.board), controller.ball)
+        state.active = controller.active_player
+        state.north_player = 0 if controller.goal_by_player[0] == -1 else 1
+        power_up_position = getattr(controller, 'power_up_position', None)
+        if power_up_position is not None:
+            state.power_up_position = state.index(*power_up_position)
+        power_up = getattr(controller, 'power_up', None)
+        if power_up is not None:
+            state.power_up = power_up
+        return state
+
+    def index(self, x, y):
+        return x * self.stride + y + 1
+
+    def position(self, index=None):
+        index = self.ball if index is None else index
+        return index // self.stride, index % self.stride - 1
+
+    def moves(self):
+        if self.winner != NONE:
+            return []
+        moves = list(POSSIBLE_ACTIONS[self.masks[self.ball] | self.blocked[self.ball]])
+        if self.power_up == self.active:
+            moves.extend([action | Action.POWER for action in moves])
+        return moves
+
+    def make(self, action):
+        mover = self.active
+        direction = action & ~Action.POWER
+        source = self.ball
+        target = self.targets[source * 8 + direction]
+        undo = (source, mover, self.masks[source], self.masks[target], self.bounce[target], self.power_up,
+                self.winner)
+
+        if not self.bounce[target]:
+            self.active = 1 - mover
+        self.masks[source] |= 1 << direction
+        self.masks[target] |= 1 << Action.opposite[direction]
+        self.bounce[target] = 1
+        self.ball = target
+
+        if self.goal[target]:
+            self.winner = self.north_player if target % self.stride == 0 else 1 - self.north_player
+        elif self.masks[target] == FULL:
+            self.active = 1 - self.active
+            self.winner = 1 - mover
+        if target == self.power_up_position:
+            self.power_up = mover
+        if action & Action.POWER and undo[5] == mover:
+            self.power_up = NONE
+            self.active = mover
+        return undo
+
+    def unmake(self, undo):
+        target = self.ball
+        source, self.active, self.masks[source], self.masks[target], self.bounce[target], self.power_up, \
+            self.winner = undo
+        self.ball = source
+
+    def invert_polarity(self):
+        self.north_player = 1 - self.north_player
+
+    def copy(self):
+        state = SearchState.__new__(SearchState)
+        state.__dict__.update(self.__dict__)
+        state.masks = bytearray(self.masks)
+        state.bounce = bytearray(self.bounce)
+        return state
+
+    def _tables(self, board):
+        targets = [NONE] * (len(board.masks) * 8)
+        blocked = bytearray(len(board.masks))
+        for x in range(self.size_x):
+            for y in range(-1, self.size_y + 1):
+                index = board.index(x, y)
+                for action, (dx, dy) in enumerate(Action.delta):
+                    if board.has_dot(x + dx, y + dy):
+                        targets[index * 8 + action] = board.index(x + dx, y + dy)
+                    else:
+                        blocked[index] |= 1 << action
+        return tuple(targets), bytes(blocked)
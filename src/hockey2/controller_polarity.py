@@ -1,6 +1,8 @@
 import random
 
+from hockey.action import Action
 from hockey.board_builder import BoardBuilder
+from hockey.board_printer import BoardPrinterCurrent
 from hockey.controller import ControllerGentle, NoRuleEnforcerFound, ApplyLegalMoveGently, GameTerminated
 
 
@@ -11,6 +13,11 @@ class ApplyPowerLegalMoveGently(ApplyLegalMoveGently):
     def apply_rule(self, action):
         initial_active = self.controller.active_player
         result = super(ApplyPowerLegalMoveGently, self).apply_rule(action)
+        if result.valid and self.controller.powered:
+            self.controller.power_moves.append(len(self.controller.actions) - 1)
+        # rolled here, before the game can end, so that records see an inversion on the final move
+        if result.valid and self.controller._roll_polarity():
+            self.controller.inversions.append(len(self.controller.actions) - 1)
         if self.controller.ball == self.controller.power_up_position:
             self.controller.power_up = initial_active
         return result
@@ -18,28 +25,43 @@ class ApplyPowerLegalMoveGently(ApplyLegalMoveGently):
 
 class ControllerPolarity(ControllerGentle):
     power_up = None
+    powered = False
 
-    def __init__(self, size_x=11, size_y=11, builder=BoardBuilder):
-        super(ControllerPolarity, self).__init__(size_x, size_y, builder)
+    def __init__(self, size_x=11, size_y=11, builder=BoardBuilder, printer=BoardPrinterCurrent, seed=None, rng=None):
+        # an injected rng only picks the seed, so that every game can be replayed from its seed alone
+        if seed is None:
+            seed = rng.getrandbits(32) if rng is not None else random.getrandbits(32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # indices into actions of moves using the power up and moves followed by an inversion
+        self.power_moves = []
+        self.inversions = []
+        super(ControllerPolarity, self).__init__(size_x, size_y, builder, printer)
         self.power_up_position = self.random_position()
 
     def move(self, action):
-        power_up = True if "power" in action and self.power_up == self.active_player else False
-        if "power" in action:
-            action = action.split(' ')[1]
+        power_up = Action.is_power(action) and self.power_up == self.active_player
+        action = Action.direction(action)
         initial_active = self.active_player
-        result = super(ControllerPolarity, self).move(action)
-        polarityInverted = False
-        if result.valid:
-            polarityInverted = random.randint(0, 10) == 9
-            if polarityInverted:
-                self.inverse_polarity()
+        self.powered = power_up
+        inversions = len(self.inversions)
+        try:
+            result = super(ControllerPolarity, self).move(action)
+        finally:
+            self.powered = False
+        # the goals swap only after the move has been scored
+        polarityInverted = len(self.inversions) > inversions
+        if polarityInverted:
+            self.inverse_polarity()
         if power_up:
             self.power_up = None
             self.active_player = initial_active
 
         return result, polarityInverted
 
+    def _roll_polarity(self):
+        return self.rng.randint(0, 10) == 9
+
     def inverse_polarity(self):
         self.goal_by_player = self.goal_by_player[::-1]
 
@@ -53,5 +75,5 @@ class ControllerPolarity(ControllerGentle):
         position = self.ball
         while position in [self.ball, (self.ball[0] + 1, self.ball[1]), (self.ball[0] - 1, self.ball[1]),
                            (self.ball[0], self.ball[1] - 1), (self.ball[0] - 1, self.ball[1] + 1)]:
-            position = random.randint(1, self.size_x - 1), random.randint(1, self.size_y - 1)
+            position = self.rng.randint(1, self.size_x - 1), self.rng.randint(1, self.size_y - 1)
         return position
@@ -0,0 +1,146 @@
+import io
+import os
+import struct
+
+import numpy as np
+
+from hockey.action import Action
+from hockey2.game_record import GameRecord
+from hockey2.game_record import REASONS
+
+INDEX = np.dtype([
+    ('start', '<u8'),
+    ('length', '<u4'),
+    ('seed', '<u4'),
+    ('winner', 'i1'),
+    ('reason', 'u1'),
+    ('size_x', '<u2'),
+    ('size_y', '<u2'),
+    ('power_x', '<i4'),
+    ('power_y', '<i4'),
+])
+MOVES_FILE = 'moves.u8'
+INDEX_FILE = 'index.bin'
+# magic and format version, bumped whenever INDEX changes
+VERSION_FILE = 'version'
+VERSION = struct.Struct('<4sH')
+MAGIC = b'HKAR'
+FORMAT = 3
+
+
+class ArchiveWriter(object):
+    # appends games to an archive directory, usable as a controller printer
+    def __init__(self, path, next_printer=None):
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        index = os.path.join(path, INDEX_FILE)
+        if os.path.exists(os.path.join(path, VERSION_FILE)) or (os.path.exists(index) and os.path.getsize(index)):
+            check_version(path)
+        else:
+            with io.open(os.path.join(path, VERSION_FILE), 'wb') as fp:
+                fp.write(VERSION.pack(MAGIC, FORMAT))
+        self.moves = io.open(os.path.join(path, MOVES_FILE), 'ab')
+        self.index = io.open(os.path.join(path, INDEX_FILE), 'ab')
+        end = self.index.seek(0, io.SEEK_END)
+        self.index.truncate(end - end % INDEX.itemsize)
+        self.start = self.moves.seek(0, io.SEEK_END)
+        self.next_printer = next_printer
+
+    def add(self, record):
+        power_x, power_y = record.power_up_position if record.power_up_position is not None else (-1, -1)
+        entry = np.array([(self.start, len(record.moves), record.seed, record.winner, REASONS.index(record.reason),
+                           record.size_x, record.size_y, power_x, power_y)], dtype=INDEX)
+        self.moves.write(record.moves)
+        self.index.write(entry.tobytes())
+        self.start += len(record.moves)
+
+    def game_ended(self, controller):
+        self.add(GameRecord.from_controller(controller))
+        self.flush()
+        if self.next_printer is not None:
+            self.next_printer.game_ended(controller)
+
+    def flush(self):
+        self.moves.flush()
+        self.index.flush()
+
+    def close(self):
+        self.moves.close()
+        self.index.close()
+
+
+def check_version(path):
+    version = os.path.join(path, VERSION_FILE)
+    data = b''
+    if os.path.exists(version):
+        with io.open(version, 'rb') as fp:
+            data = fp.read()
+    if len(data) != VERSION.size or VERSION.unpack(data) != (MAGIC, FORMAT):
+        raise ValueError('{} is not a version {} game archive, rebuild it with archive.py build'.format(path, FORMAT))
+
+
+def _map(path, dtype):
+    # a torn tail after a crash mid-write is ignored, only whole entries are mapped
+    count = os.path.getsize(path) // np.dtype(dtype).itemsize
+    if count == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', shape=(count,))
+
+
+class GameArchive(object):
+    def __init__(self, path):
+        check_version(path)
+        self.index = _map(os.path.join(path, INDEX_FILE), INDEX)
+        self.moves = _map(os.path.join(path, MOVES_FILE), np.uint8)
+
+    def __len__(self):
+        return len(self.index)
+
+    def records(self, games=None):
+        # lightweight GameRecords for code that replays games one by one
+        for game in range(len(self)) if games is None else games:
+            entry = self.index[game]
+            power_up_position = (int(entry['power_x']), int(entry['power_y'])) if entry['power_x'] >= 0 else None
+            yield GameRecord(int(entry['seed']), int(entry['size_x']), int(entry['size_y']), power_up_position,
+                             None, int(entry['winner']), REASONS[entry['reason']], self.game_moves(game).tobytes())
+
+    def game_moves(self, game):
+        entry = self.index[game]
+        return self.moves[entry['start']:entry['start'] + entry['length']]
+
+    def first_mover_win_rate(self):
+        decided = self.index['winner'] >= 0
+        if not decided.any():
+            return 0.0
+        return float(np.mean(self.index['winner'][decided] == 0))
+
+    def reasons(self):
+        counts = np.bincount(self.index['reason'], minlength=len(REASONS))
+        return dict((reason, int(count)) for reason, count in zip(REASONS, counts) if count)
+
+    def lengths(self, reason=None):
+        if reason is None:
+            return self.index['length']
+        return self.index['length'][self.index['reason'] == REASONS.index(reason)]
+
+    def length_histogram(self, bins=10, reason=None):
+        return np.histogram(self.lengths(reason), bins=bins)
+
+    def length_percentiles(self, percentiles=(10, 50, 90), reason=None):
+        lengths = self.lengths(reason)
+        if len(lengths) == 0:
+            return [0.0 for _ in percentiles]
+        return [float(value) for value in np.percentile(lengths, percentiles)]
+
+    def power_moves(self):
+        return int(np.count_nonzero(self.moves & Action.POWER))
+
+    def direction_counts(self):
+        return np.bincount(self.moves & (Action.POWER - 1), minlength=Action.POWER)
+
+
+def build_archive(records, path):
+    writer = ArchiveWriter(path)
+    for record in records:
+        writer.add(record)
+    writer.close()
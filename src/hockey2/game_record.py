@@ -0,0 +1,173 @@
+import io
+import struct
+
+from hockey.action import Action
+from hockey.compact_board import CompactBoardBuilder
+from hockey.controller import ControllerGentle
+from hockey2.controller_polarity import ControllerPolarity
+
+# seed, size, power up position, winner, reason, move count
+HEADER = struct.Struct('<IHHiibBI')
+# names are line-sized, LineReceiver.MAX_LENGTH keeps them under 64k
+NAME = struct.Struct('<H')
+
+# one byte per move: direction and power bits as in Action, then these
+INVERTED = 16
+SECOND_PLAYER = 32
+MOVE = 0x0F
+
+REASONS = (None, 'a goal was made', 'checkmate was achieved', 'timeout', 'too many invalid moves', 'opponent crashed')
+
+
+class GameRecord(object):
+    def __init__(self, seed, size_x, size_y, power_up_position, players, winner, reason, moves):
+        self.seed = seed
+        self.size_x = size_x
+        self.size_y = size_y
+        self.power_up_position = power_up_position
+        self.players = players
+        self.winner = winner
+        self.reason = reason
+        self.moves = moves
+
+    @staticmethod
+    def from_controller(controller):
+        power_moves = set(getattr(controller, 'power_moves', ()))
+        inversions = set(getattr(controller, 'inversions', ()))
+        moves = bytearray()
+        for ply, (_, player, action) in enumerate(controller.actions):
+            move = action | (SECOND_PLAYER if player else 0)
+            if ply in power_moves:
+                move |= Action.POWER
+            if ply in inversions:
+                move |= INVERTED
+            moves.append(move)
+
+        result = controller.result
+        winner = controller.players.index(result.winner) if result is not None and result.winner is not None else -1
+        reason = result.reason if result is not None and result.reason in REASONS else None
+        return GameRecord(getattr(controller, 'seed', 0), controller.size_x, controller.size_y,
+                          getattr(controller, 'power_up_position', None), list(controller.players), winner, reason,
+                          bytes(moves))
+
+    def encode(self):
+        power_x, power_y = self.power_up_position if self.power_up_position is not None else (-1, -1)
+        parts = [HEADER.pack(self.seed, self.size_x, self.size_y, power_x, power_y, self.winner,
+                             REASONS.index(self.reason), len(self.moves))]
+        for player in self.players:
+            name = player.encode('UTF-8')
+            parts.append(NAME.pack(len(name)))
+            parts.append(name)
+        parts.append(self.moves)
+        return b''.join(parts)
+
+    @staticmethod
+    def decode(fp):
+        # a torn record at the end of the log, e.g. after a crash mid-write, reads as the end of the log
+        header = read_exactly(fp, HEADER.size)
+        if header is None:
+            return None
+        seed, size_x, size_y, power_x, power_y, winner, reason, length = HEADER.unpack(header)
+        players = []
+        for _ in range(2):
+            size = read_exactly(fp, NAME.size)
+            name = read_exactly(fp, NAME.unpack(size)[0]) if size is not None else None
+            if name is None:
+                return None
+            players.append(name.decode('UTF-8'))
+        moves = read_exactly(fp, length)
+        if moves is None:
+            return None
+        power_up_position = (power_x, power_y) if power_x >= 0 else None
+        return GameRecord(seed, size_x, size_y, power_up_position, players, winner, REASONS[reason], moves)
+
+
+def read_exactly(fp, size):
+    data = fp.read(size)
+    return data if len(data) == size else None
+
+
+class RecordWriter(object):
+    # a controller printer appending every finished game to one file, then handing it to the next printer
+    def __init__(self, path, next_printer=None):
+        self.fp = io.open(path, 'ab')
+        self.next_printer = next_printer
+
+    def game_ended(self, controller):
+        self.fp.write(GameRecord.from_controller(controller).encode())
+        self.fp.flush()
+        if self.next_printer is not None:
+            self.next_printer.game_ended(controller)
+
+    def close(self):
+        self.fp.close()
+
+
+class RecordReader(object):
+    def __init__(self, path):
+        self.fp = io.open(path, 'rb')
+        self.offsets = None
+
+    def __iter__(self):
+        self.fp.seek(0)
+        while True:
+            record = GameRecord.decode(self.fp)
+            if record is None:
+                return
+            yield record
+
+    def index(self):
+        if self.offsets is None:
+            self.offsets = []
+            end = self.fp.seek(0, io.SEEK_END)
+            offset = 0
+            while offset + HEADER.size <= end:
+                self.fp.seek(offset)
+                position = offset + HEADER.size
+                length = HEADER.unpack(self.fp.read(HEADER.size))[-1]
+                for _ in range(2):
+                    size = read_exactly(self.fp, NAME.size)
+                    if size is None:
+                        break
+                    position += NAME.size + NAME.unpack(size)[0]
+                    self.fp.seek(position)
+                if size is None or position + length > end:
+                    break
+                self.offsets.append(offset)
+                offset = position + length
+        return self.offsets
+
+    def __len__(self):
+        return len(self.index())
+
+    def __getitem__(self, game):
+        self.fp.seek(self.index()[game])
+        return GameRecord.decode(self.fp)
+
+    def close(self):
+        self.fp.close()
+
+
+class ReplayController(ControllerPolarity):
+    def __init__(self, record, builder=CompactBoardBuilder):
+        self.record = record
+        super(ReplayController, self).__init__(record.size_x, record.size_y, builder=builder, printer=None,
+                                               seed=record.seed)
+
+    def random_position(self):
+        return self.record.power_up_position
+
+    def _roll_polarity(self):
+        return bool(self.record.moves[len(self.actions) - 1] & INVERTED)
+
+
+def replay(record, ply=None, builder=CompactBoardBuilder):
+    if record.power_up_position is None:
+        controller = ControllerGentle(record.size_x, record.size_y, builder=builder, printer=None)
+    else:
+        controller = ReplayController(record, builder)
+    for player in record.players:
+        controller.register(player)
+    for move in record.moves[:ply]:
+        controller.move(move & MOVE)
+    return controller
@@ -0,0 +1,62 @@
+from collections import deque
+
+from twisted.internet import threads
+from twisted.logger import Logger
+
+from hockey.board_printer import BoardPrinterCurrent
+
+
+class AsyncPrinter(object):
+    log = Logger()
+    defer_to_thread = staticmethod(threads.deferToThread)
+
+    def __init__(self, printer=BoardPrinterCurrent, concurrency=1, max_queued=16):
+        self.printer = printer()
+        self.concurrency = concurrency
+        self.max_queued = max_queued
+        self.queue = deque()
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+    def game_ended(self, controller):
+        if len(self.queue) >= self.max_queued:
+            self.dropped += 1
+            return
+        self.submitted += 1
+        self.queue.append(controller)
+        self.max_depth = max(self.max_depth, len(self.queue))
+        self._dispatch()
+
+    def stats(self):
+        return {
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'failed': self.failed,
+            'dropped': self.dropped,
+            'queued': len(self.queue),
+            'running': self.running,
+            'max_depth': self.max_depth,
+        }
+
+    def _dispatch(self):
+        while self.queue and self.running < self.concurrency:
+            controller = self.queue.popleft()
+            self.running += 1
+            d = self.defer_to_thread(self.printer.game_ended, controller)
+            d.addCallbacks(self._completed, self._failed)
+            d.addBoth(self._done)
+
+    def _completed(self, _):
+        self.completed += 1
+
+    def _failed(self, failure):
+        self.failed += 1
+        self.log.failure('Rendering failed', failure)
+
+    def _done(self, _):
+        self.running -= 1
+        self._dispatch()
@@ -1,16 +1,26 @@
+from twisted.internet import reactor
 from twisted.protocols.basic import LineReceiver
 
 from network.game_on import GameOn
 from network.get_name import GetName
+from network.protocol import TEXT
+from network.protocol import encode
 
 
 class Communication(LineReceiver, object):
     communication_handler = []
-    users = {}
+    registry = None
+    connection_id = None
     state = 'get_name'
+    name = None
+    protocol = TEXT
+    snapshot = False
+    clock = reactor
+    flush_call = None
 
-    def __init__(self, users, online_gateway):
-        self.users = users
+    def __init__(self, registry, online_gateway):
+        self.pending = []
+        self.registry = registry
         self.online_gateway = online_gateway
         self.communication_handler = self.get_communication_handler(online_gateway)
 
@@ -21,24 +31,45 @@ class Communication(LineReceiver, object):
         }
 
     def sendLine(self, line):
-        super(Communication, self).sendLine(line.encode('UTF-8'))
+        # lines sent during one reactor turn go out in a single write
+        self.pending.append(line.encode('UTF-8'))
+        if self.flush_call is None:
+            self.flush_call = self.clock.callLater(0, self.flush)
+
+    def flush(self):
+        if self.flush_call is not None and self.flush_call.active():
+            self.flush_call.cancel()
+        self.flush_call = None
+        if self.pending:
+            self.pending.append(b'')
+            self.transport.write(self.delimiter.join(self.pending))
+            self.pending = []
+
+    def send(self, message, event=None):
+        self.sendLine(encode(self.protocol, message, event))
 
     def lineReceived(self, line):
         line = line.decode('UTF-8')
         self.communication_handler[self.state].lineReceived(line)
 
     def connectionMade(self):
+        self.connection_id = self.registry.connect()
         self.communication_handler[self.state].connectionMade()
 
     def connectionLost(self, reason):
-        index = [i for i in self.users if self.users[i] is self.name][0]
-        del self.users[index]
+        if self.flush_call is not None and self.flush_call.active():
+            self.flush_call.cancel()
+        self.flush_call = None
+        self.pending = []
+        if self.name is None:
+            return
+        self.online_gateway.unregister_online(self.name)
+        self.registry.release(self.name, self.connection_id)
 
     def _game_on(self):
         self.state = 'game_on'
 
     def _register(self, name):
         self.name = name
-        self.users[len(self.users)] = name
         self.online_gateway.register_online(name, self.communication_handler[self.state])
         self.communication_handler[self.state].name = name
@@ -0,0 +1,77 @@
+import heapq
+import itertools
+
+from twisted.internet import reactor
+
+
+class Deadline(object):
+    def __init__(self, scheduler, when, callback, args):
+        self.scheduler = scheduler
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    def cancel(self):
+        if self.active:
+            self.active = False
+            self.scheduler._cancelled(self)
+
+
+class DeadlineScheduler(object):
+    def __init__(self, clock=reactor):
+        self.clock = clock
+        self.heap = []
+        self.counter = itertools.count()
+        self.cancelled = 0
+        self.call = None
+
+    def schedule(self, delay, callback, *args):
+        deadline = Deadline(self, self.clock.seconds() + delay, callback, args)
+        heapq.heappush(self.heap, (deadline.when, next(self.counter), deadline))
+        self._arm()
+        return deadline
+
+    def pending(self):
+        return len(self.heap) - self.cancelled
+
+    def _cancelled(self, deadline):
+        self.cancelled += 1
+        if self.cancelled > len(self.heap) // 2:
+            self.heap = [entry for entry in self.heap if entry[2].active]
+            heapq.heapify(self.heap)
+            self.cancelled = 0
+        self._arm()
+
+    def _arm(self):
+        while self.heap and not self.heap[0][2].active:
+            heapq.heappop(self.heap)
+            self.cancelled -= 1
+        if not self.heap:
+            if self.call is not None:
+                self.call.cancel()
+                self.call = None
+            return
+        when = self.heap[0][0]
+        if self.call is not None:
+            if self.call.getTime() <= when:
+                return
+            self.call.cancel()
+        self.call = self.clock.callLater(max(when - self.clock.seconds(), 0), self._fire)
+
+    def _fire(self):
+        self.call = None
+        now = self.clock.seconds()
+        try:
+            while self.heap and self.heap[0][0] <= now:
+                deadline = heapq.heappop(self.heap)[2]
+                if deadline.active:
+                    deadline.active = False
+                    deadline.callback(*deadline.args)
+                else:
+                    self.cancelled -= 1
+        finally:
+            self._arm()
+
+
+default_scheduler = DeadlineScheduler()
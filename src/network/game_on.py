@@ -1,7 +1,8 @@
 from hockey.action import Action
 from network.iplayer_handler import IPlayerHandler
+from network.protocol import decode_action
 
-POSSIBILITIES = list(Action.move.keys())
+POSSIBILITIES = dict((name, Action.to_number(name)) for name in Action.move)
 
 
 class GameOn(IPlayerHandler):
@@ -12,14 +13,17 @@ class GameOn(IPlayerHandler):
         self.online_gateway = online_gateway
 
     def lineReceived(self, line):
-        line = line.lower()
-        if line in POSSIBILITIES:
-            self.online_gateway.move_player(self.name, line)
+        action = decode_action(self.handler.protocol, line, POSSIBILITIES)
+        if action is not None:
+            self.online_gateway.move_player(self.name, action)
         else:
-            self.handler.sendLine('Invalid action')
+            self.handler.send('Invalid action', {'kind': 'error', 'error': 'invalid action'})
 
-    def send_message(self, message):
-        self.handler.sendLine(message)
+    def send_message(self, message, event=None):
+        if self.handler.snapshot and event is not None and event['kind'] == 'active':
+            event = dict(event, state=self.online_gateway.snapshot(self.name))
+        self.handler.send(message, event)
 
     def end_game(self):
+        self.handler.flush()
         self.handler.transport.loseConnection()
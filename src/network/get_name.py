@@ -1,4 +1,5 @@
 from network.online_gateway import MESSAGES
+from network.protocol import negotiate
 
 
 class GetName(object):
@@ -9,9 +10,17 @@ class GetName(object):
         self.communication.sendLine(MESSAGES['who'])
 
     def lineReceived(self, name):
-        if name in self.communication.users.values():
-            self.communication.sendLine(MESSAGES['name_taken'])
+        negotiated = negotiate(name)
+        if negotiated is not None:
+            self.communication.protocol, self.communication.snapshot = negotiated
+            self.communication.send(MESSAGES['protocol'].format(self.communication.protocol),
+                                    {'kind': 'protocol', 'protocol': self.communication.protocol})
             return
-        self.communication.sendLine(MESSAGES['welcome'].format(name, len(self.communication.users)))
+        player = self.communication.connection_id
+        if not self.communication.registry.reserve(name, player):
+            self.communication.send(MESSAGES['name_taken'], {'kind': 'name_taken'})
+            return
+        self.communication.send(MESSAGES['welcome'].format(name, player),
+                                {'kind': 'welcome', 'name': name, 'player': player})
         self.communication._game_on()
         self.communication._register(name)
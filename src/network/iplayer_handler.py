@@ -5,7 +5,7 @@ ABC = abc.ABCMeta('ABC', (object,), {})
 
 class IPlayerHandler(ABC):
     @abc.abstractmethod
-    def send_message(self, message):
+    def send_message(self, message, event=None):
         pass
 
     @abc.abstractmethod
@@ -0,0 +1,37 @@
+from collections import OrderedDict
+
+
+class Lobby(object):
+    def __init__(self, gateway_factory):
+        self.gateway_factory = gateway_factory
+        self.waiting = OrderedDict()
+        self.sessions = {}
+
+    def register_online(self, player_name, handler):
+        self.waiting[player_name] = handler
+        if len(self.waiting) == 2:
+            gateway = self.gateway_factory()
+            gateway.on_end = self._session_ended
+            while self.waiting:
+                name, handler = self.waiting.popitem(last=False)
+                self.sessions[name] = gateway
+                gateway.register_online(name, handler)
+
+    def unregister_online(self, player_name):
+        self.waiting.pop(player_name, None)
+
+    def move_player(self, player_name, action):
+        gateway = self.sessions.get(player_name)
+        if gateway is not None:
+            gateway.move_player(player_name, action)
+
+    def snapshot(self, player_name):
+        return self.sessions[player_name].snapshot(player_name)
+
+    def games(self):
+        return set(self.sessions.values())
+
+    def _session_ended(self, gateway):
+        for name in gateway.controller.players:
+            if self.sessions.get(name) is gateway:
+                del self.sessions[name]
@@ -0,0 +1,14 @@
+import random
+
+
+class MessageTrace(object):
+    # fraction of games whose messages are logged, changeable while serving
+    def __init__(self, rate=0.0, rng=None):
+        self.rate = rate
+        self.rng = rng if rng is not None else random.Random()
+
+    def sample(self):
+        return self.rate >= 1 or (self.rate > 0 and self.rng.random() < self.rate)
+
+    def enabled(self):
+        return self.rate > 0
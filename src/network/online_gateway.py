@@ -1,12 +1,18 @@
-import time
+import uuid
 
-from twisted.internet import task
+from twisted.logger import Logger
+
+from hockey.action import Action
+from network.deadline_scheduler import default_scheduler
+from network.message_trace import MessageTrace
 
 MESSAGES = {
     'who': "What's your name?",
+    'protocol': 'protocol is {}',
     'name_taken': "Name taken, please choose another.",
     'welcome': 'Welcome, {} you\'re player {}!',
     'game_on': 'Game is on',
+    'size': "board size is {}",
     'ball_at': "ball is at {}",
     'goal_north': "your goal is north",
     'goal_south': "your goal is south",
@@ -20,29 +26,41 @@ MESSAGES = {
 
 
 class OnlineGateway(object):
-    looping_call = None
+    turn_deadline = None
     msgid = 0
+    on_end = None
+    log = Logger()
 
-    def __init__(self, controller_factory, timeout, debug):
+    def __init__(self, controller_factory, timeout, debug, scheduler=default_scheduler, trace=None, spectators=None):
         self.timeout = timeout
+        self.spectators = spectators
         self.controller_factory = controller_factory
         self.debug = debug
+        self.scheduler = scheduler
+        self.trace = trace if trace is not None else MessageTrace(1.0 if debug else 0.0)
         self._initialize_controller()
 
     def _initialize_controller(self):
         self.handlers = []
-        self.last_time_played = {}
         self.state = "on"
         self.controller = self.controller_factory()
-        self.looping_call = task.LoopingCall(self.is_active_player_timeout)
-        self.looping_call.start(1.0)
+        self.game_id = uuid.uuid4().hex
+        self.traced = self.trace.sample()
 
     def register_online(self, player_name, handler):
         self.controller.register(player_name)
         self.handlers.append(handler)
         if len(self.handlers) == 2:
+            self.log.info('Game {game_id} started: {players}, seed {seed}', game_id=self.game_id,
+                          players=list(self.controller.players), seed=getattr(self.controller, 'seed', None))
             self._starting_game()
-            self.last_time_played[self.controller.active_player] = time.time()
+            self._arm_turn_timeout()
+
+    def unregister_online(self, player_name):
+        if len(self.handlers) < 2 and player_name in self.controller.players:
+            index = self.controller.players.index(player_name)
+            del self.controller.players[index]
+            del self.handlers[index]
 
     def move_player(self, name, action):
         if self.controller.active_player_name() is name:
@@ -50,61 +68,99 @@ class OnlineGateway(object):
             if action_result.valid:
                 if action_result.terminated:
                     reason = MESSAGES['won'].format(action_result.winner, action_result.reason)
-                    self._game_id_ended(reason)
+                    self._game_id_ended(reason, {'kind': 'end', 'winner': action_result.winner,
+                                                 'reason': action_result.reason})
                 else:
-                    self.last_time_played[self.controller.active_player] = time.time()
-                    self._inform_players(MESSAGES['action'].format(name, action))
+                    self._arm_turn_timeout()
+                    self._inform_players(MESSAGES['action'].format(name, Action.from_number(action)),
+                                         {'kind': 'action', 'player': name, 'action': action})
                     self._inform_active_player_turn()
             else:
-                self._inform_active_players(MESSAGES['invalid'])
+                self._inform_active_players(MESSAGES['invalid'], {'kind': 'invalid'})
         else:
-            self._inform_inactive_players(MESSAGES['ignoring_inactive'].format(action))
+            self._inform_inactive_players(MESSAGES['ignoring_inactive'].format(Action.from_number(action)),
+                                          {'kind': 'ignored', 'action': action})
 
-    def _inform_players(self, message):
-        self._inform_active_players(message)
-        self._inform_inactive_players(message)
+    def _inform_players(self, message, event):
+        self._inform_active_players(message, event)
+        self._inform_inactive_players(message, event)
+        self._publish(event)
 
-    def _inform_active_players(self, message):
-        self._ship_it(self.controller.active_player, message)
+    def _inform_active_players(self, message, event):
+        self._ship_it(self.controller.active_player, message, event)
 
-    def _inform_inactive_players(self, message):
+    def _inform_inactive_players(self, message, event):
         id = (self.controller.active_player + 1) % 2
-        self._ship_it(id, message)
+        self._ship_it(id, message, event)
 
-    def _ship_it(self, player_id, message):
+    def _ship_it(self, player_id, message, event):
         self.msgid += 1
-        if self.debug:
-            print(self.msgid, message)
-        self.handlers[player_id].send_message('{} - {}'.format(message, self.msgid))
-
-    def is_active_player_timeout(self):
-        if self.state is "ended":
-            self.looping_call.stop()
-            self._initialize_controller()
-        if self.last_time_played:
-            start_time = self.last_time_played[self.controller.active_player]
-            now = time.time()
-            delta = now - start_time
-            if delta > self.timeout:
-                reason = MESSAGES['timeout'].format(self.controller.in_active_player_name())
-                self._game_id_ended(reason)
-                self.looping_call.stop()
-                self._initialize_controller()
-
-    def _game_id_ended(self, m):
-        self._inform_active_players(m)
-        self._inform_inactive_players(m)
-        print(m)
+        if self.traced and self.trace.enabled():
+            # info, so that sampling alone turns tracing on without lowering --log-level
+            self.log.info('Game {game_id} #{msgid} to {player}: {message}', game_id=self.game_id, msgid=self.msgid,
+                          player=self.controller.players[player_id], message=message)
+        self.handlers[player_id].send_message('{} - {}'.format(message, self.msgid), dict(event, id=self.msgid))
+
+    def _publish(self, event):
+        if self.spectators is not None:
+            self.spectators.publish(dict(event, game=self.game_id))
+
+    def snapshot(self, player_name=None):
+        controller = self.controller
+        return {
+            'ball': controller.ball,
+            'active': controller.active_player_name(),
+            'north_player': controller.players[controller.goal_by_player.index(-1)],
+            'moves': [(x, y, player, action) for (x, y), player, action in controller.actions],
+        }
+
+    def _arm_turn_timeout(self):
+        if self.turn_deadline is not None:
+            self.turn_deadline.cancel()
+        self.turn_deadline = self.scheduler.schedule(self.timeout, self._turn_timed_out)
+
+    def _turn_timed_out(self):
+        self.turn_deadline = None
+        winner = self.controller.in_active_player_name()
+        self.controller.forfeit('timeout')
+        self._game_id_ended(MESSAGES['timeout'].format(winner), {'kind': 'end', 'winner': winner, 'reason': 'timeout'})
+
+    def _game_id_ended(self, m, event):
+        if self.turn_deadline is not None:
+            self.turn_deadline.cancel()
+            self.turn_deadline = None
+        self._inform_active_players(m, event)
+        self._inform_inactive_players(m, event)
+        self._publish(event)
+        self.log.info('Game {game_id} ended: {result}', game_id=self.game_id, result=m,
+                      players=list(self.controller.players), winner=event['winner'], reason=event['reason'],
+                      moves=len(self.controller.actions))
         self.state = "ended"
         self.handlers[0].end_game()
         self.handlers[1].end_game()
+        if self.on_end is not None:
+            self.on_end(self)
+        else:
+            self._initialize_controller()
 
     def _inform_active_player_turn(self):
-        self._inform_active_players(MESSAGES['active_player'].format(self.controller.active_player_name()))
+        name = self.controller.active_player_name()
+        event = {'kind': 'active', 'player': name}
+        self._inform_active_players(MESSAGES['active_player'].format(name), event)
+        self._publish(event)
 
     def _starting_game(self):
-        self._inform_players(MESSAGES['game_on'])
-        self._inform_players(MESSAGES['ball_at'].format(self.controller.ball))
-        self._inform_active_players(MESSAGES['goal_north'])
-        self._inform_inactive_players(MESSAGES['goal_south'])
+        size = self.controller.size_x, self.controller.size_y
+        self._publish({'kind': 'start', 'players': list(self.controller.players)})
+        self._inform_players(MESSAGES['game_on'], {'kind': 'game_on'})
+        self._inform_players(MESSAGES['size'].format(size), {'kind': 'size', 'size': size})
+        self._inform_players(MESSAGES['ball_at'].format(self.controller.ball),
+                             {'kind': 'ball', 'position': self.controller.ball})
+        self._inform_active_players(MESSAGES['goal_north'], {'kind': 'goal', 'goal': 'north'})
+        self._inform_inactive_players(MESSAGES['goal_south'], {'kind': 'goal', 'goal': 'south'})
+        self._announce_rules()
         self._inform_active_player_turn()
+
+    def _announce_rules(self):
+        # game variants describe their extra board state here, before the first turn
+        pass
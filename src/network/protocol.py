@@ -0,0 +1,33 @@
+import json
+
+TEXT = 'text'
+JSON = 'json'
+PROTOCOLS = (TEXT, JSON)
+
+
+def negotiate(line):
+    # 'protocol json' or 'protocol json snapshot', sent before the name
+    words = line.split()
+    if len(words) >= 2 and words[0] == 'protocol' and words[1] in PROTOCOLS:
+        return words[1], 'snapshot' in words[2:]
+    return None
+
+
+def encode(protocol, message, event):
+    if protocol != JSON:
+        return message
+    if event is None:
+        event = {'kind': 'text', 'text': message}
+    return json.dumps(event, separators=(',', ':'))
+
+
+def decode_action(protocol, line, possibilities):
+    if protocol != JSON:
+        return possibilities.get(line.lower())
+    try:
+        action = json.loads(line)['action']
+    except (ValueError, TypeError, KeyError):
+        return None
+    if isinstance(action, int) and action in possibilities.values():
+        return action
+    return None
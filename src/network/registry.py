@@ -0,0 +1,27 @@
+import itertools
+
+
+class ConnectionRegistry(object):
+    def __init__(self):
+        self.ids = itertools.count()
+        self.names = {}
+
+    def connect(self):
+        return next(self.ids)
+
+    def reserve(self, name, connection_id):
+        if name in self.names:
+            return False
+        self.names[name] = connection_id
+        return True
+
+    def release(self, name, connection_id):
+        # only the connection holding the name can free it
+        if self.names.get(name) == connection_id:
+            del self.names[name]
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def __len__(self):
+        return len(self.names)
@@ -0,0 +1,95 @@
+import json
+from collections import deque
+
+from twisted.internet.interfaces import IPushProducer
+from twisted.internet.protocol import Factory
+from twisted.protocols.basic import LineReceiver
+from zope.interface import implementer
+
+
+class SpectatorHub(object):
+    def __init__(self):
+        self.subscribers = set()
+        self.published = 0
+
+    def subscribe(self, subscriber):
+        self.subscribers.add(subscriber)
+
+    def unsubscribe(self, subscriber):
+        self.subscribers.discard(subscriber)
+
+    def publish(self, event):
+        self.published += 1
+        if not self.subscribers:
+            return
+        line = json.dumps(event, separators=(',', ':')).encode('UTF-8')
+        for subscriber in list(self.subscribers):
+            subscriber.deliver(event['game'], line)
+
+    def stats(self):
+        return {
+            'subscribers': len(self.subscribers),
+            'published': self.published,
+            'dropped': sum(subscriber.dropped for subscriber in self.subscribers),
+        }
+
+
+@implementer(IPushProducer)
+class Spectator(LineReceiver, object):
+    game = None
+
+    def __init__(self, hub, max_buffered):
+        self.hub = hub
+        self.buffer = deque(maxlen=max_buffered)
+        self.paused = False
+        self.dropped = 0
+        self.unreported = 0
+
+    def connectionMade(self):
+        self.transport.registerProducer(self, True)
+        self.hub.subscribe(self)
+
+    def connectionLost(self, reason):
+        self.hub.unsubscribe(self)
+
+    def lineReceived(self, line):
+        # 'watch <game id>' follows one game, 'watch all' every game
+        words = line.decode('UTF-8').split()
+        if len(words) == 2 and words[0] == 'watch':
+            self.game = None if words[1] == 'all' else words[1]
+
+    def deliver(self, game, line):
+        if self.game is not None and game != self.game:
+            return
+        if not self.paused:
+            self.sendLine(line)
+            return
+        if len(self.buffer) == self.buffer.maxlen:
+            # a slow spectator loses its oldest events, never stalls the game
+            self.dropped += 1
+            self.unreported += 1
+        self.buffer.append(line)
+
+    def pauseProducing(self):
+        self.paused = True
+
+    def resumeProducing(self):
+        self.paused = False
+        if self.unreported:
+            self.sendLine(json.dumps({'kind': 'dropped', 'count': self.unreported}).encode('UTF-8'))
+            self.unreported = 0
+        while self.buffer and not self.paused:
+            self.sendLine(self.buffer.popleft())
+
+    def stopProducing(self):
+        self.buffer.clear()
+        self.hub.unsubscribe(self)
+
+
+class SpectatorFactory(Factory):
+    def __init__(self, hub, max_buffered=256):
+        self.hub = hub
+        self.max_buffered = max_buffered
+
+    def buildProtocol(self, addr):
+        return Spectator(self.hub, self.max_buffered)
@@ -3,18 +3,19 @@ from network.game_on import GameOn
 from network.get_name import GetName
 from hockey.action import Action
 from network.iplayer_handler import IPlayerHandler
+from network.protocol import decode_action
 
-POSSIBILITIES = list(Action.move.keys()) + ['power {}'.format(i) for i in Action.move.keys()]
+POSSIBILITIES = dict((name, number) for number, name in Action.Name.items())
 
 class PowerGameOn(GameOn):
     name = None
 
     def lineReceived(self, line):
-        line = line.lower()
-        if line in POSSIBILITIES:
-            self.online_gateway.move_player(self.name, line)
+        action = decode_action(self.handler.protocol, line, POSSIBILITIES)
+        if action is not None:
+            self.online_gateway.move_player(self.name, action)
         else:
-            self.handler.sendLine('Invalid action')
+            self.handler.send('Invalid action', {'kind': 'error', 'error': 'invalid action'})
 
 
 class GameOn(IPlayerHandler):
@@ -25,16 +26,19 @@ class GameOn(IPlayerHandler):
         self.online_gateway = online_gateway
 
     def lineReceived(self, line):
-        line = line.lower()
-        if line in POSSIBILITIES:
-            self.online_gateway.move_player(self.name, line)
+        action = decode_action(self.handler.protocol, line, POSSIBILITIES)
+        if action is not None:
+            self.online_gateway.move_player(self.name, action)
         else:
-            self.handler.sendLine('Invalid action')
+            self.handler.send('Invalid action', {'kind': 'error', 'error': 'invalid action'})
 
-    def send_message(self, message):
-        self.handler.sendLine(message)
+    def send_message(self, message, event=None):
+        if self.handler.snapshot and event is not None and event['kind'] == 'active':
+            event = dict(event, state=self.online_gateway.snapshot(self.name))
+        self.handler.send(message, event)
 
     def end_game(self):
+        self.handler.flush()
         self.handler.transport.loseConnection()
 
 
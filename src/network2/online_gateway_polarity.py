@@ -1,13 +1,14 @@
-import time
-
+from hockey.action import Action
 from network.online_gateway import OnlineGateway
 
 MESSAGES = {
     'power_up': 'power up is at {}',
     'who': "What's your name?",
+    'protocol': 'protocol is {}',
     'name_taken': "Name taken, please choose another.",
     'welcome': 'Welcome, {} you\'re player {}!',
     'game_on': 'Game is on',
+    'size': "board size is {}",
     'ball_at': "ball is at {}",
     'goal_north': "your goal is north",
     'goal_south': "your goal is south",
@@ -22,7 +23,6 @@ MESSAGES = {
 
 
 class OnlineGatewayPolarity(OnlineGateway):
-    looping_call = None
     msgid = 0
 
     def move_player(self, name, action):
@@ -31,22 +31,28 @@ class OnlineGatewayPolarity(OnlineGateway):
             if action_result.valid:
                 if action_result.terminated:
                     reason = MESSAGES['won'].format(action_result.winner, action_result.reason)
-                    self._game_id_ended(reason)
+                    self._game_id_ended(reason, {'kind': 'end', 'winner': action_result.winner,
+                                                 'reason': action_result.reason})
                 else:
-                    self.last_time_played[self.controller.active_player] = time.time()
+                    self._arm_turn_timeout()
                     if inverted:
-                        self._inform_players(MESSAGES['inverted'])
-                    self._inform_players(MESSAGES['action'].format(name, action))
+                        self._inform_players(MESSAGES['inverted'], {'kind': 'inverted'})
+                    self._inform_players(MESSAGES['action'].format(name, Action.from_number(action)),
+                                         {'kind': 'action', 'player': name, 'action': action})
                     self._inform_active_player_turn()
             else:
-                self._inform_active_players(MESSAGES['invalid'])
+                self._inform_active_players(MESSAGES['invalid'], {'kind': 'invalid'})
         else:
-            self._inform_inactive_players(MESSAGES['ignoring_inactive'].format(action))
+            self._inform_inactive_players(MESSAGES['ignoring_inactive'].format(Action.from_number(action)),
+                                          {'kind': 'ignored', 'action': action})
+
+    def _announce_rules(self):
+        self._inform_players(MESSAGES['power_up'].format(self.controller.power_up_position),
+                             {'kind': 'power_up', 'position': self.controller.power_up_position})
 
-    def _starting_game(self):
-        self._inform_players(MESSAGES['game_on'])
-        self._inform_players(MESSAGES['ball_at'].format(self.controller.ball))
-        self._inform_active_players(MESSAGES['goal_north'])
-        self._inform_inactive_players(MESSAGES['goal_south'])
-        self._inform_active_player_turn()
-        self._inform_players(MESSAGES['power_up'].format(self.controller.power_up_position))
+    def snapshot(self, player_name=None):
+        snapshot = super(OnlineGatewayPolarity, self).snapshot(player_name)
+        power_up = self.controller.power_up
+        snapshot['power_up_position'] = self.controller.power_up_position
+        snapshot['power_up'] = self.controller.players[power_up] if power_up is not None else None
+        return snapshot
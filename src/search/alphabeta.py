@@ -0,0 +1,150 @@
+import time
+
+from hockey.search_state import NONE
+from search.zobrist import Zobrist
+
+WIN = 1000000
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class TranspositionTable(object):
+    def __init__(self, bits=20):
+        self.mask = (1 << bits) - 1
+        self.entries = [None] * (1 << bits)
+
+    def get(self, key):
+        entry = self.entries[key & self.mask]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def put(self, key, depth, value, flag, move):
+        slot = key & self.mask
+        entry = self.entries[slot]
+        if entry is None or entry[0] != key or entry[1] <= depth:
+            self.entries[slot] = (key, depth, value, flag, move)
+
+
+class AlphaBeta(object):
+    def __init__(self, time_budget=1.0, max_depth=64, table_bits=20):
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.table = TranspositionTable(table_bits)
+        self.zobrist = None
+        self.nodes = 0
+        self.depth = 0
+        self.deadline = None
+
+    def best_move(self, root):
+        if self.zobrist is None or len(self.zobrist.balls) != len(root.masks):
+            self.zobrist = Zobrist(len(root.masks))
+        moves = root.moves()
+        if len(moves) <= 1:
+            return moves[0] if moves else None
+
+        # without a time budget the search always goes to max_depth, which makes it reproducible
+        self.deadline = time.time() + self.time_budget if self.time_budget is not None else float('inf')
+        self.nodes = 0
+        best = moves[0]
+        for depth in range(1, self.max_depth + 1):
+            state = root.copy()
+            try:
+                value = self._search(state, self.zobrist.hash(state), depth, -WIN - 1, WIN + 1)
+            except SearchTimeout:
+                break
+            self.depth = depth
+            entry = self.table.get(self.zobrist.hash(root))
+            if entry is not None:
+                best = entry[4]
+            if abs(value) >= WIN - self.max_depth:
+                break
+        return best
+
+    def evaluate(self, state):
+        x, y = state.position()
+        goal_x = state.goal_x
+        lateral = max(abs(x - goal_x) - 1, 0)
+        north = y + 1 + lateral
+        south = state.size_y - y + lateral
+        own, other = (north, south) if state.active == state.north_player else (south, north)
+        value = other - own
+        if state.power_up == state.active:
+            value += 2
+        elif state.power_up != NONE:
+            value -= 2
+        return value
+
+    def _search(self, state, key, depth, alpha, beta):
+        self.nodes += 1
+        if self.nodes & 1023 == 0 and time.time() > self.deadline:
+            raise SearchTimeout()
+
+        if state.winner != NONE:
+            return WIN - self.max_depth + depth if state.winner == state.active else -WIN + self.max_depth - depth
+        if depth == 0:
+            return self.evaluate(state)
+
+        original_alpha = alpha
+        entry = self.table.get(key)
+        tt_move = None
+        if entry is not None:
+            tt_move = entry[4]
+            if entry[1] >= depth:
+                if entry[3] == EXACT:
+                    return entry[2]
+                elif entry[3] == LOWER:
+                    alpha = max(alpha, entry[2])
+                else:
+                    beta = min(beta, entry[2])
+                if alpha >= beta:
+                    return entry[2]
+
+        moves = self._ordered(state, tt_move)
+        if not moves:
+            return -WIN + self.max_depth - depth
+
+        best_value, best_move = -WIN - 1, moves[0]
+        mover = state.active
+        for move in moves:
+            undo = state.make(move)
+            child_key = self.zobrist.after(key, state, undo, move)
+            if state.active == mover:
+                value = self._search(state, child_key, depth - 1, alpha, beta)
+            else:
+                value = -self._search(state, child_key, depth - 1, -beta, -alpha)
+            state.unmake(undo)
+            if value > best_value:
+                best_value, best_move = value, move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= original_alpha:
+            flag = UPPER
+        elif best_value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table.put(key, depth, best_value, flag, best_move)
+        return best_value
+
+    def _ordered(self, state, tt_move):
+        moves = state.moves()
+        goal_y = -1 if state.active == state.north_player else state.size_y
+        stride = state.stride
+        base = state.ball * 8
+        targets = state.targets
+
+        def distance(move):
+            target = targets[base + (move & 7)]
+            return abs(target % stride - 1 - goal_y) + max(abs(target // stride - state.goal_x) - 1, 0)
+
+        moves.sort(key=distance)
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+        return moves
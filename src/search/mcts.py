@@ -0,0 +1,107 @@
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from hockey.search_state import NONE
+
+
+class Node(object):
+    __slots__ = ['move', 'player', 'children', 'untried', 'visits', 'wins']
+
+    def __init__(self, move, player, moves):
+        self.move = move
+        # player who made `move`, the one credited with this node's wins
+        self.player = player
+        self.children = []
+        self.untried = moves
+        self.visits = 0
+        self.wins = 0.0
+
+    def select(self, exploration):
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.wins / child.visits +
+                   exploration * math.sqrt(log_visits / child.visits))
+
+
+def search(root, time_budget, seed=None, exploration=1.4, max_rollout=400, iterations=None):
+    # a fixed number of rollouts instead of the wall clock makes a seeded search reproducible
+    rng = random.Random(seed)
+    tree = Node(None, NONE, root.moves())
+    deadline = time.time() + time_budget if iterations is None else None
+    rollouts = 0
+    while rollouts == 0 or (rollouts < iterations if deadline is None else time.time() < deadline):
+        state = root.copy()
+        node = tree
+        path = [node]
+        while not node.untried and node.children:
+            node = node.select(exploration)
+            state.make(node.move)
+            path.append(node)
+        if node.untried:
+            move = node.untried.pop(rng.randrange(len(node.untried)))
+            player = state.active
+            state.make(move)
+            child = Node(move, player, state.moves())
+            node.children.append(child)
+            node = child
+            path.append(node)
+
+        winner = _rollout(state, rng, max_rollout)
+        for visited in path:
+            visited.visits += 1
+            if winner == visited.player:
+                visited.wins += 1
+            elif winner == NONE:
+                visited.wins += 0.5
+        rollouts += 1
+    return dict((child.move, (child.visits, child.wins)) for child in tree.children), rollouts
+
+
+def _rollout(state, rng, max_rollout):
+    for _ in range(max_rollout):
+        moves = state.moves()
+        if not moves:
+            break
+        state.make(moves[rng.randrange(len(moves))])
+    return state.winner
+
+
+class MonteCarlo(object):
+    def __init__(self, time_budget=1.0, workers=1, exploration=1.4, iterations=None, rng=None):
+        self.time_budget = time_budget
+        self.workers = workers
+        self.exploration = exploration
+        self.iterations = iterations
+        self.executor = ProcessPoolExecutor(workers) if workers > 1 else None
+        self.rng = rng if rng is not None else random.Random()
+        self.rollouts = 0
+        self.rollouts_per_second = 0.0
+
+    def best_move(self, root):
+        moves = root.moves()
+        if len(moves) <= 1:
+            return moves[0] if moves else None
+
+        start = time.time()
+        if self.executor is None:
+            results = [search(root, self.time_budget, self.rng.getrandbits(32), self.exploration,
+                              iterations=self.iterations)]
+        else:
+            futures = [self.executor.submit(search, root, self.time_budget, self.rng.getrandbits(32),
+                                            self.exploration, iterations=self.iterations)
+                       for _ in range(self.workers)]
+            results = [future.result() for future in futures]
+
+        visits = dict((move, 0) for move in moves)
+        self.rollouts = 0
+        for statistics, rollouts in results:
+            self.rollouts += rollouts
+            for move, (count, _) in statistics.items():
+                visits[move] += count
+        self.rollouts_per_second = self.rollouts / (time.time() - start)
+        return max(moves, key=lambda move: visits[move])
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
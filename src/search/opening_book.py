@@ -0,0 +1,113 @@
+import io
+import struct
+from collections import defaultdict
+
+import numpy as np
+
+from hockey.search_state import SearchState
+from hockey2.game_record import INVERTED
+from hockey2.game_record import MOVE
+from hockey2.game_record import SECOND_PLAYER
+from search.zobrist import Zobrist
+
+# magic, board size, plies covered, table capacity
+HEADER = struct.Struct('<4sHHHI')
+MAGIC = b'HKB2'
+ENTRY = np.dtype([
+    ('key', '<u8'),
+    ('move', 'u1'),
+    ('games', '<u4'),
+    ('wins', '<u4'),
+    ('visits', '<u4'),
+])
+
+
+def position_key(zobrist, state):
+    # the zobrist hash ignores where the power up sits, fold it in as a rotated ball key
+    key = zobrist.hash(state)
+    if state.power_up_position >= 0:
+        salt = zobrist.balls[state.power_up_position]
+        key ^= ((salt << 1) | (salt >> 63)) & 0xFFFFFFFFFFFFFFFF
+    return key
+
+
+class OpeningBookBuilder(object):
+    def __init__(self, size_x, size_y, plies=8, min_games=2):
+        self.size_x = size_x
+        self.size_y = size_y
+        self.plies = plies
+        self.min_games = min_games
+        self.zobrist = Zobrist(len(SearchState.initial(size_x, size_y).masks))
+        # position key -> move -> [games, wins for the mover]
+        self.stats = defaultdict(lambda: defaultdict(lambda: [0, 0]))
+
+    def add(self, record):
+        if (record.size_x, record.size_y) != (self.size_x, self.size_y):
+            return
+        state = SearchState.initial(self.size_x, self.size_y, record.power_up_position)
+        key = position_key(self.zobrist, state)
+        for move in bytearray(record.moves[:self.plies]):
+            action = move & MOVE
+            stats = self.stats[key][action]
+            stats[0] += 1
+            stats[1] += record.winner == (1 if move & SECOND_PLAYER else 0)
+            undo = state.make(action)
+            key = self.zobrist.after(key, state, undo, action)
+            if move & INVERTED:
+                state.invert_polarity()
+                key = position_key(self.zobrist, state)
+
+    def entries(self):
+        for key, moves in self.stats.items():
+            visits = sum(games for games, _ in moves.values())
+            candidates = [(move, games, wins) for move, (games, wins) in moves.items() if games >= self.min_games]
+            if key and candidates:
+                # best smoothed win rate for the mover
+                move, games, wins = max(candidates, key=lambda c: (c[2] + 1.0) / (c[1] + 2.0))
+                yield key, move, games, wins, visits
+
+    def save(self, path):
+        entries = list(self.entries())
+        capacity = 1
+        while capacity < 2 * len(entries):
+            capacity *= 2
+        table = np.zeros(capacity, dtype=ENTRY)
+        mask = capacity - 1
+        for entry in entries:
+            slot = entry[0] & mask
+            while table[slot]['key']:
+                slot = (slot + 1) & mask
+            table[slot] = entry
+        with io.open(path, 'wb') as fp:
+            fp.write(HEADER.pack(MAGIC, self.size_x, self.size_y, self.plies, capacity))
+            fp.write(table.tobytes())
+        return len(entries)
+
+
+class OpeningBook(object):
+    def __init__(self, path):
+        with io.open(path, 'rb') as fp:
+            magic, self.size_x, self.size_y, self.plies, capacity = HEADER.unpack(fp.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError('{} is not an opening book'.format(path))
+        self.table = np.memmap(path, dtype=ENTRY, mode='r', offset=HEADER.size, shape=(capacity,))
+        self.mask = capacity - 1
+        self.zobrist = Zobrist(len(SearchState.initial(self.size_x, self.size_y).masks))
+
+    def lookup(self, key):
+        slot = key & self.mask
+        while True:
+            entry = self.table[slot]
+            if entry['key'] == key:
+                return entry
+            if not entry['key']:
+                return None
+            slot = (slot + 1) & self.mask
+
+    def move(self, state):
+        if (state.size_x, state.size_y) != (self.size_x, self.size_y):
+            return None
+        entry = self.lookup(position_key(self.zobrist, state))
+        if entry is None:
+            return None
+        return int(entry['move'])
@@ -0,0 +1,38 @@
+import random
+
+from hockey.action import Action
+
+
+class Zobrist(object):
+    def __init__(self, cells, seed=0):
+        rng = random.Random(seed)
+        self.edges = [rng.getrandbits(64) for _ in range(cells * 8)]
+        self.balls = [rng.getrandbits(64) for _ in range(cells)]
+        self.players = [rng.getrandbits(64) for _ in range(2)]
+        # power up owner, indexed by owner + 1 so that NONE maps to the first key
+        self.power = [rng.getrandbits(64) for _ in range(3)]
+        self.polarity = rng.getrandbits(64)
+
+    def hash(self, state):
+        key = self.balls[state.ball] ^ self.players[state.active] ^ self.power[state.power_up + 1]
+        if state.north_player:
+            key ^= self.polarity
+        edges = self.edges
+        for index, mask in enumerate(state.masks):
+            while mask:
+                bit = mask & -mask
+                key ^= edges[index * 8 + bit.bit_length() - 1]
+                mask ^= bit
+        return key
+
+    def after(self, key, state, undo, action):
+        source, mover, _, _, _, power_up, _ = undo
+        direction = action & ~Action.POWER
+        target = state.ball
+        key ^= self.balls[source] ^ self.balls[target]
+        key ^= self.edges[source * 8 + direction] ^ self.edges[target * 8 + Action.opposite[direction]]
+        if state.active != mover:
+            key ^= self.players[mover] ^ self.players[state.active]
+        if state.power_up != power_up:
+            key ^= self.power[power_up + 1] ^ self.power[state.power_up + 1]
+        return key
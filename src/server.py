@@ -1,20 +1,78 @@
+import argparse
+import io
+import signal
+import sys
+
 from twisted.internet import reactor
 from twisted.internet.protocol import Factory
+from twisted.logger import FilteringLogObserver
+from twisted.logger import LogLevel
+from twisted.logger import LogLevelFilterPredicate
+from twisted.logger import globalLogBeginner
+from twisted.logger import jsonFileLogObserver
+from twisted.logger import textFileLogObserver
 
 from hockey2.controller_polarity import ControllerPolarity
+from hockey2.game_record import RecordWriter
+from network.async_printer import AsyncPrinter
+from network.lobby import Lobby
+from network.message_trace import MessageTrace
+from network.registry import ConnectionRegistry
+from network.spectators import SpectatorFactory
+from network.spectators import SpectatorHub
 from network2.online_gateway_polarity import OnlineGatewayPolarity
 from network2.communication import CommunicationP2
 
 
 class ChatFactory(Factory):
-    def __init__(self):
-        self.users = {}
-        self.online_gateway = OnlineGatewayPolarity(lambda: ControllerPolarity(15, 15), timeout=600, debug=True)
+    def __init__(self, printer, trace, spectators=None):
+        self.registry = ConnectionRegistry()
+        self.online_gateway = Lobby(lambda: OnlineGatewayPolarity(lambda: ControllerPolarity(15, 15, printer=printer),
+                                                                  timeout=600, debug=False, trace=trace,
+                                                                  spectators=spectators))
 
     def buildProtocol(self, addr):
-        return CommunicationP2(self.users, self.online_gateway)
+        return CommunicationP2(self.registry, self.online_gateway)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Run the hockey server.')
+    parser.add_argument('--trace', type=float, default=0.0,
+                        help='fraction of games whose messages are logged at info level, SIGUSR1 toggles it')
+    parser.add_argument('--log-level', default='info', choices=['debug', 'info', 'warn', 'error'])
+    parser.add_argument('--spectator-port', type=int, default=8024, help='port streaming live games as json lines')
+    parser.add_argument('--record', help='append every finished game to this record file')
+    parser.add_argument('--log-file', help='write json events to this file instead of text to stdout')
+    return parser.parse_args()
+
+
+def start_logging(args):
+    if args.log_file:
+        observer = jsonFileLogObserver(io.open(args.log_file, 'a', buffering=1 << 16))
+    else:
+        observer = textFileLogObserver(sys.stdout)
+    predicate = LogLevelFilterPredicate(LogLevel.levelWithName(args.log_level))
+    globalLogBeginner.beginLoggingTo([FilteringLogObserver(observer, [predicate])])
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    start_logging(args)
+
+    trace = MessageTrace(args.trace)
+    # the rate a toggle restores, defaulting to every game
+    traced_rate = args.trace or 1.0
+
+    def toggle_trace(signum, frame):
+        trace.rate = 0.0 if trace.enabled() else traced_rate
 
+    signal.signal(signal.SIGUSR1, toggle_trace)
 
-cf = ChatFactory()
-reactor.listenTCP(8023, cf)
-reactor.run()
+    printer = AsyncPrinter()
+    if args.record:
+        printer = RecordWriter(args.record, printer)
+    spectators = SpectatorHub()
+    cf = ChatFactory(lambda: printer, trace, spectators)
+    reactor.listenTCP(8023, cf)
+    reactor.listenTCP(args.spectator_port, SpectatorFactory(spectators))
+    reactor.run()
@@ -0,0 +1,35 @@
+import argparse
+
+from arena.bots import BOTS
+from arena.tournament import ResultLog
+from arena.tournament import Tournament
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Run a resumable multiprocess tournament between bots.')
+    parser.add_argument('bots', nargs='+', help='bots to enter, among {}'.format(', '.join(sorted(BOTS))))
+    parser.add_argument('--output', default='tournament.jsonl', help='results file, .jsonl or .csv')
+    parser.add_argument('--games', type=int, default=100, help='games per pairing')
+    parser.add_argument('--swiss', type=int, metavar='ROUNDS', help='play a swiss system instead of a round robin')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--size', type=int, nargs=2, default=(15, 15))
+    parser.add_argument('--gentle', action='store_true', help='play without power up and polarity inversion')
+    parser.add_argument('--workers', type=int, help='number of processes, defaults to the number of cores')
+    return parser.parse_args()
+
+
+def participants(bots):
+    labels = {}
+    for index, bot in enumerate(bots):
+        if bot not in BOTS:
+            raise SystemExit('Unknown bot {}'.format(bot))
+        labels[bot if bots.count(bot) == 1 else '{}{}'.format(bot, index)] = bot
+    return labels
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    tournament = Tournament(participants(args.bots), args.games, args.seed, args.size, args.gentle, args.workers)
+    standings = tournament.run(ResultLog(args.output), args.swiss)
+    for label, score in standings.most_common():
+        print('{}: {}'.format(label, score))
@@ -0,0 +1,48 @@
+import random
+from unittest import TestCase
+
+from src.hockey.search_state import SearchState
+from src.search.alphabeta import AlphaBeta
+from src.search.alphabeta import TranspositionTable
+from src.search.zobrist import Zobrist
+
+
+class AlphaBetaTest(TestCase):
+    def testIncrementalHash(self):
+        rng = random.Random(0)
+        state = SearchState.initial(11, 11, power_up_position=(3, 4))
+        zobrist = Zobrist(len(state.masks))
+        key = zobrist.hash(state)
+        while state.moves():
+            move = rng.choice(state.moves())
+            undo = state.make(move)
+            key = zobrist.after(key, state, undo, move)
+            self.assertEqual(zobrist.hash(state), key)
+
+    def testTakesImmediateWin(self):
+        rng = random.Random(1)
+        search = AlphaBeta(time_budget=0.05, table_bits=12)
+        checked = 0
+        for game in range(40):
+            state = SearchState.initial(11, 11)
+            while state.moves():
+                mover = state.active
+                winning = []
+                for move in state.moves():
+                    undo = state.make(move)
+                    if state.winner == mover:
+                        winning.append(move)
+                    state.unmake(undo)
+                if winning:
+                    self.assertIn(search.best_move(state), winning)
+                    checked += 1
+                state.make(rng.choice(state.moves()))
+        self.assertTrue(checked > 0)
+
+    def testTableIsBounded(self):
+        table = TranspositionTable(bits=4)
+        for key in range(1000):
+            table.put(key, 1, 0, 0, 0)
+        self.assertEqual(16, len(table.entries))
+        self.assertIsNone(table.get(3))
+        self.assertEqual(999, table.get(999)[0])
@@ -0,0 +1,78 @@
+import random
+from unittest import TestCase
+
+from twisted.internet.defer import Deferred
+from twisted.logger import Logger
+
+from src.hockey.action import Action
+from src.hockey.controller import ControllerGentle
+from src.network.async_printer import AsyncPrinter
+
+
+class RenderError(Exception):
+    pass
+
+
+class FakePrinter(object):
+    def __init__(self):
+        self.printed = []
+
+    def game_ended(self, controller):
+        self.printed.append(controller)
+
+
+class AsyncPrinterTest(TestCase):
+    def setUp(self):
+        self.rendered = FakePrinter()
+        self.printer = AsyncPrinter(lambda: self.rendered, concurrency=1, max_queued=2)
+        self.pending = []
+        self.printer.defer_to_thread = self.defer_to_thread
+
+    def defer_to_thread(self, function, *args):
+        d = Deferred()
+        self.pending.append((d, function, args))
+        return d
+
+    def finish(self, error=None):
+        d, function, args = self.pending.pop(0)
+        if error is None:
+            d.callback(function(*args))
+        else:
+            d.errback(error)
+
+    def testDropsWhenQueueIsFull(self):
+        for game in range(5):
+            self.printer.game_ended(game)
+        # one game rendering, two queued, the rest dropped
+        self.assertEqual(1, len(self.pending))
+        self.assertEqual({'submitted': 3, 'completed': 0, 'failed': 0, 'dropped': 2, 'queued': 2, 'running': 1,
+                          'max_depth': 2}, self.printer.stats())
+
+        while self.pending:
+            self.finish()
+        self.assertEqual([0, 1, 2], self.rendered.printed)
+        self.assertEqual({'submitted': 3, 'completed': 3, 'failed': 0, 'dropped': 2, 'queued': 0, 'running': 0,
+                          'max_depth': 2}, self.printer.stats())
+
+    def testFailedRenderKeepsTheQueueMoving(self):
+        events = []
+        self.printer.log = Logger(observer=events.append)
+        self.printer.game_ended('first')
+        self.printer.game_ended('second')
+        self.finish(RenderError('disk full'))
+        self.assertEqual(1, len(events))
+        self.assertTrue(events[0]['log_failure'].check(RenderError))
+        self.finish()
+        self.assertEqual(['second'], self.rendered.printed)
+        stats = self.printer.stats()
+        self.assertEqual((1, 1, 0), (stats['completed'], stats['failed'], stats['running']))
+
+    def testControllerWithoutPrinter(self):
+        controller = ControllerGentle(11, 11, printer=None)
+        controller.register('Bob')
+        controller.register('Malory')
+        rng = random.Random(1)
+        result = controller.move(Action.NORTH)
+        while not result.terminated:
+            result = controller.move(rng.choice(controller.get_possible_actions(*controller.ball)))
+        self.assertIsNone(controller.printer)
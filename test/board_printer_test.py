@@ -18,4 +18,4 @@ class BoardPrinterTest(TestCase):
         still_on = ActionResults(BOB, False), ActionResults(MALORY, False)
         result = ActionResults(BOB, False)
         while result in still_on:
-            result = self.controller.move(Action.from_number(random.randint(0, 7)))
+            result = self.controller.move(random.randint(Action.NORTH, Action.NORTH_WEST))
@@ -0,0 +1,151 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from twisted.internet.task import Clock
+from twisted.internet.testing import StringTransport
+
+from src.client import RandomHockeyClient
+from src.hockey.action import Action
+from src.hockey2.controller_polarity import ControllerPolarity
+from src.hockey2.game_record import GameRecord
+from src.network.deadline_scheduler import DeadlineScheduler
+from src.network2.online_gateway_polarity import OnlineGatewayPolarity
+from src.search.opening_book import OpeningBook
+from src.search.opening_book import OpeningBookBuilder
+
+
+class FixedBook(object):
+    def __init__(self, move):
+        self.fixed = move
+
+    def move(self, state):
+        return self.fixed
+
+
+class ClientHandler(object):
+    # hands the gateway's lines straight to a client
+    def __init__(self, client):
+        self.client = client
+
+    def send_message(self, message, event=None):
+        self.client.lineReceived(message.encode('UTF-8'))
+
+    def end_game(self):
+        pass
+
+
+class RandomHockeyClientTest(TestCase):
+    def setUp(self):
+        self.client = RandomHockeyClient('Bob', False)
+        self.client.ball_at(7, 7, 1)
+        self.client.goal_is('north')
+
+    def testFreeEdgesFollowTakenEdges(self):
+        degree = self.client.free_edges().sum(axis=2)
+        self.assertEqual(1, degree[(0, 0)])
+        self.assertEqual(3, degree[(0, 3)])
+        self.assertEqual(8, degree[(7, 7)])
+        self.client.mark_edge_as_taken((7, 7), (6, 7))
+        degree = self.client.free_edges().sum(axis=2)
+        self.assertEqual(7, degree[(7, 7)])
+        self.assertEqual(7, degree[(6, 7)])
+        self.assertEqual(len(list(self.client.neighborhood((7, 7)))), degree[(7, 7)])
+
+    def testEdgesAreStoredFromBothEnds(self):
+        self.assertEqual((15, 15, 8), self.client.edge_taken.shape)
+        self.client.mark_edge_as_taken((7, 7), (6, 8))
+        self.assertEqual(1, self.client.edge_taken[(7, 7, Action.NORTH_EAST)])
+        self.assertEqual(1, self.client.edge_taken[(6, 8, Action.SOUTH_WEST)])
+        self.assertNotIn('north east', [edge for edge, pos in self.client.neighborhood((7, 7))])
+
+    def testDeadEndsPropagateAlongCorridors(self):
+        client = self.client
+        for x in range(1, 14):
+            for edge, pos in list(client.neighborhood((3, x))):
+                if pos[0] != 3:
+                    client.mark_edge_as_taken((3, x), pos)
+        client.blacklist[(3, 0)] = True
+        client.update_blacklist()
+        self.assertTrue(all(client.blacklist[(3, x)] for x in range(1, 14)))
+        self.assertFalse(client.blacklist[(7, 3)])
+
+    def testBookMoveWhileInBookAndLegal(self):
+        client = self.client
+        client.play_game = lambda: 'fallback'
+        client.book = FixedBook(Action.NORTH)
+        client.book_plies = 1
+        self.assertEqual('north', client.choose_move())
+
+        client.player_moved('Bob', Action.EAST, 2)
+        self.assertEqual('fallback', client.choose_move())
+
+        client.book_plies = 4
+        self.assertEqual('north', client.choose_move())
+        # straight back over the edge just played
+        client.book = FixedBook(Action.WEST)
+        self.assertEqual('fallback', client.choose_move())
+
+    def testFallsBackWithoutBookMove(self):
+        client = self.client
+        client.play_game = lambda: 'fallback'
+        self.assertEqual('fallback', client.choose_move())
+        client.book = FixedBook(None)
+        client.book_plies = 4
+        self.assertEqual('fallback', client.choose_move())
+
+    def testGeometryFollowsAnnouncedSize(self):
+        client = RandomHockeyClient('Bob', False)
+        client.lineReceived(b'board size is (21, 31) - 3')
+        client.lineReceived(b'ball is at (10, 15) - 5')
+        client.goal_is('south')
+        self.assertEqual((31, 21), client.grid.shape)
+        self.assertEqual((15, 10), client.ball_position)
+        self.assertEqual((31, 9), client.goal_position)
+        self.assertTrue(client.blacklist[(0, 9)] and client.blacklist[(15, 10)])
+        client.polarity_inverted()
+        self.assertEqual((-1, 9), client.goal_position)
+        self.assertIn(client.play_game(), Action.Number)
+
+    def testLinesAreDispatched(self):
+        client = RandomHockeyClient('Bob', False)
+        transport = StringTransport()
+        client.makeConnection(transport)
+        for line in ['Game is on - 1', 'board size is (15, 15) - 3', 'ball is at (7, 7) - 5',
+                     'your goal is north - 7', 'power up is at (3, 4) - 9', 'Malory is active player - 11',
+                     'Malory did go power south - 13', 'Bob is active player - 15']:
+            client.lineReceived(line.encode('UTF-8'))
+        self.assertEqual((8, 7), client.ball_position)
+        self.assertEqual((4, 3), client.powerup_position)
+        self.assertEqual(13, client.grid[(8, 7)])
+        lines = transport.value().decode('UTF-8').split('\r\n')
+        self.assertEqual('Bob', lines[0])
+        self.assertIn(lines[1], Action.Number)
+
+
+class OpeningBookClientTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testBookMoveOnTheServerSequence(self):
+        controller = ControllerPolarity(11, 11, printer=None, seed=3)
+        builder = OpeningBookBuilder(11, 11, plies=2, min_games=1)
+        builder.add(GameRecord(3, 11, 11, controller.power_up_position, ['Bob', 'Malory'], 0, 'a goal was made',
+                               bytes(bytearray([Action.SOUTH_EAST]))))
+        path = os.path.join(self.directory, 'book.bin')
+        builder.save(path)
+
+        client = RandomHockeyClient('Bob', False)
+        client.book = OpeningBook(path)
+        client.book_plies = 2
+        transport = StringTransport()
+        client.makeConnection(transport)
+        gateway = OnlineGatewayPolarity(lambda: controller, timeout=600, debug=False,
+                                        scheduler=DeadlineScheduler(Clock()))
+        gateway.register_online('Bob', ClientHandler(client))
+        gateway.register_online('Malory', ClientHandler(RandomHockeyClient('Malory', False)))
+        self.assertEqual(['Bob', 'south east'], transport.value().decode('UTF-8').split('\r\n')[:2])
@@ -0,0 +1,68 @@
+from unittest import TestCase
+
+from twisted.internet.task import Clock
+from twisted.internet.testing import StringTransport
+
+from src.hockey.controller import ControllerGentle
+from src.network.communication import Communication
+from src.network.deadline_scheduler import DeadlineScheduler
+from src.network.lobby import Lobby
+from src.network.online_gateway import OnlineGateway
+from src.network.registry import ConnectionRegistry
+
+
+class CountingTransport(StringTransport):
+    writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        super(CountingTransport, self).write(data)
+
+
+class CommunicationTest(TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.lobby = Lobby(lambda: OnlineGateway(lambda: ControllerGentle(11, 11, printer=None), timeout=5,
+                                                 debug=False, scheduler=DeadlineScheduler(self.clock)))
+        self.registry = ConnectionRegistry()
+        self.bob, self.bob_transport = self._connect('Bob')
+        self.malory, self.malory_transport = self._connect('Malory')
+
+    def _connect(self, name):
+        communication = Communication(self.registry, self.lobby)
+        communication.clock = self.clock
+        transport = CountingTransport()
+        communication.makeConnection(transport)
+        communication.lineReceived(name.encode('UTF-8'))
+        return communication, transport
+
+    def testStartingGameIsOneWrite(self):
+        self.assertEqual(0, self.bob_transport.writes)
+        self.clock.advance(0)
+        self.assertEqual(1, self.bob_transport.writes)
+        lines = self.bob_transport.value().decode('UTF-8').split('\r\n')
+        self.assertEqual(["What's your name?", "Welcome, Bob you're player 0!", 'Game is on - 1',
+                          'board size is (11, 11) - 3', 'ball is at (5, 5) - 5', 'your goal is north - 7',
+                          'Bob is active player - 9', ''], lines)
+
+    def testEndOfGameIsFlushedBeforeClosing(self):
+        self.clock.advance(0)
+        self.bob.lineReceived(b'south')
+        self.clock.advance(5)
+        self.assertTrue(self.bob_transport.disconnecting)
+        self.assertTrue(self.bob_transport.value().decode('UTF-8').endswith('Bob won : timeout - 14\r\n'))
+        self.assertEqual([], self.clock.getDelayedCalls())
+
+    def testNamesAreReleasedOnDisconnect(self):
+        self.clock.advance(0)
+        eve, transport = self._connect('Bob')
+        self.clock.advance(0)
+        self.assertIn('Name taken, please choose another.', transport.value().decode('UTF-8'))
+        self.assertEqual(2, eve.connection_id)
+
+        eve.connectionLost(None)
+        self.assertIn('Bob', self.registry)
+        self.bob.connectionLost(None)
+        self.assertNotIn('Bob', self.registry)
+        self.assertEqual(1, len(self.registry))
+        self.assertTrue(self.registry.reserve('Bob', eve.connection_id))
@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from src.hockey.action import Action
+from src.hockey.board_builder import BoardBuilder
+from src.hockey.compact_board import CompactBoardBuilder
+from src.hockey.controller import Controller
+from test import controller_test
+
+
+class CompactControllerTest(controller_test.ControllerTest):
+    def initialize_controller(self, x, y):
+        self.controller = Controller(x, y, builder=CompactBoardBuilder)
+        self.controller.register(controller_test.BOB)
+        self.controller.register(controller_test.MALORY)
+
+
+class CompactBoardTest(TestCase):
+    def testSameBoardAsBuilder(self):
+        for size_x, size_y in [(11, 11), (11, 15), (15, 15), (10, 12)]:
+            board = BoardBuilder.board(size_x, size_y)
+            compact = CompactBoardBuilder.board(size_x, size_y)
+            for x in range(-1, size_x + 1):
+                for y in range(-2, size_y + 2):
+                    self.assertEqual(board.has_dot(x, y), compact.has_dot(x, y))
+                    if board.has_dot(x, y):
+                        self.assertEqual(board.is_bounce(x, y), compact.is_bounce(x, y))
+                        self.assertEqual(board.is_goal(x, y), compact.is_goal(x, y))
+                        self.assertEqual(board.possible_actions(x, y), compact.possible_actions(x, y))
+
+    def testCopyIsIndependent(self):
+        compact = CompactBoardBuilder.board(11, 11)
+        copy = compact.copy()
+        copy.take(5, 5, Action.NORTH)
+        copy.set_bounce(5, 5)
+        self.assertFalse(compact.is_taken(5, 5, Action.NORTH))
+        self.assertFalse(compact.is_bounce(5, 5))
+        self.assertTrue(CompactBoardBuilder.board(11, 11).possible_actions(5, 5))
@@ -0,0 +1,33 @@
+import random
+from unittest import TestCase
+
+from src.hockey.action import Action
+from src.hockey2.controller_polarity import ControllerPolarity
+
+
+class ControllerPolarityTest(TestCase):
+    def play(self, controller, actions):
+        controller.register('Bob')
+        controller.register('Malory')
+        inversions = []
+        for action in actions:
+            result, inverted = controller.move(action)
+            inversions.append(inverted)
+            if result.terminated:
+                break
+        return inversions
+
+    def testSeedReproducesGame(self):
+        actions = [random.Random(3).randint(Action.NORTH, Action.NORTH_WEST) for _ in range(60)]
+        first = ControllerPolarity(15, 15, printer=None, seed=12)
+        second = ControllerPolarity(15, 15, printer=None, seed=12)
+        self.assertEqual(first.power_up_position, second.power_up_position)
+        self.assertEqual(self.play(first, actions), self.play(second, actions))
+        self.assertEqual(first.actions, second.actions)
+        self.assertEqual(12, first.seed)
+
+    def testInjectedRng(self):
+        controller = ControllerPolarity(15, 15, printer=None, rng=random.Random(5))
+        self.assertEqual(random.Random(5).getrandbits(32), controller.seed)
+        self.assertEqual(ControllerPolarity(15, 15, printer=None, seed=controller.seed).power_up_position,
+                         controller.power_up_position)
@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from twisted.internet.task import Clock
+
+from src.network.deadline_scheduler import DeadlineScheduler
+
+
+class DeadlineSchedulerTest(TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.scheduler = DeadlineScheduler(self.clock)
+        self.fired = []
+
+    def testFiresInDeadlineOrder(self):
+        self.scheduler.schedule(0.5, self.fired.append, 'b')
+        self.scheduler.schedule(0.25, self.fired.append, 'a')
+        self.scheduler.schedule(2, self.fired.append, 'c')
+        self.clock.advance(0.3)
+        self.assertEqual(['a'], self.fired)
+        self.clock.advance(0.3)
+        self.assertEqual(['a', 'b'], self.fired)
+        self.clock.advance(2)
+        self.assertEqual(['a', 'b', 'c'], self.fired)
+        self.assertEqual([], self.clock.getDelayedCalls())
+
+    def testSingleReactorCall(self):
+        for i in range(100):
+            self.scheduler.schedule(1 + i / 100.0, self.fired.append, i)
+        self.assertEqual(1, len(self.clock.getDelayedCalls()))
+        self.clock.advance(3)
+        self.assertEqual(list(range(100)), self.fired)
+
+    def testCancel(self):
+        deadline = self.scheduler.schedule(0.1, self.fired.append, 'a')
+        self.scheduler.schedule(0.2, self.fired.append, 'b')
+        deadline.cancel()
+        self.clock.advance(1)
+        self.assertEqual(['b'], self.fired)
+        self.assertEqual(0, self.scheduler.pending())
+
+    def testCancelledDeadlinesAreCompacted(self):
+        for i in range(1000):
+            self.scheduler.schedule(600, self.fired.append, i).cancel()
+        self.assertTrue(len(self.scheduler.heap) < 10)
+        self.assertEqual([], self.clock.getDelayedCalls())
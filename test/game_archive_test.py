@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from src.hockey.action import Action
+from src.hockey2.game_archive import ArchiveWriter
+from src.hockey2.game_archive import GameArchive
+from src.hockey2.game_archive import build_archive
+from src.hockey2.game_record import GameRecord
+
+
+def record(winner, reason, moves):
+    return GameRecord(7, 11, 11, (2, 3), ['Bob', 'Malory'], winner, reason, bytes(bytearray(moves)))
+
+
+class GameArchiveTest(TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def testEmptyArchive(self):
+        build_archive([], self.path)
+        archive = GameArchive(self.path)
+        self.assertEqual(0, len(archive))
+        self.assertEqual({}, archive.reasons())
+        self.assertEqual(0.0, archive.first_mover_win_rate())
+
+    def testRejectsOtherFormats(self):
+        build_archive([record(0, 'a goal was made', [Action.NORTH] * 4)], self.path)
+        os.remove(os.path.join(self.path, 'version'))
+        self.assertRaises(ValueError, GameArchive, self.path)
+        self.assertRaises(ValueError, ArchiveWriter, self.path)
+
+        with open(os.path.join(self.path, 'version'), 'wb') as fp:
+            fp.write(b'HKAR\x01\x00')
+        self.assertRaises(ValueError, GameArchive, self.path)
+
+    def testTornIndexTail(self):
+        build_archive([record(0, 'a goal was made', [Action.NORTH] * 4),
+                       record(1, 'timeout', [Action.SOUTH] * 2)], self.path)
+        with open(os.path.join(self.path, 'index.bin'), 'ab') as fp:
+            fp.write(b'\x07' * 5)
+        self.assertEqual(2, len(GameArchive(self.path)))
+
+        writer = ArchiveWriter(self.path)
+        writer.add(record(0, 'timeout', [Action.WEST] * 3))
+        writer.close()
+        archive = GameArchive(self.path)
+        self.assertEqual(3, len(archive))
+        self.assertEqual([Action.WEST] * 3, list(archive.game_moves(2)))
+
+    def testQueries(self):
+        build_archive([record(0, 'a goal was made', [Action.NORTH] * 4),
+                       record(1, 'checkmate was achieved', [Action.SOUTH, Action.EAST | Action.POWER])], self.path)
+        writer = ArchiveWriter(self.path)
+        writer.add(record(0, 'timeout', [Action.WEST] * 9))
+        writer.add(record(-1, None, []))
+        writer.close()
+
+        archive = GameArchive(self.path)
+        self.assertEqual(4, len(archive))
+        self.assertEqual([Action.SOUTH, Action.EAST | Action.POWER], list(archive.game_moves(1)))
+        self.assertEqual([Action.WEST] * 9, list(archive.game_moves(2)))
+        self.assertAlmostEqual(2 / 3.0, archive.first_mover_win_rate())
+        self.assertEqual({None: 1, 'a goal was made': 1, 'checkmate was achieved': 1, 'timeout': 1},
+                         archive.reasons())
+        self.assertEqual([9], list(archive.lengths('timeout')))
+        self.assertEqual(1, archive.power_moves())
+        self.assertEqual([4, 0, 1, 0, 1, 0, 9, 0], list(archive.direction_counts()))
+        counts, edges = archive.length_histogram(bins=3)
+        self.assertEqual(4, counts.sum())
@@ -0,0 +1,102 @@
+import io
+import os
+import random
+import tempfile
+from unittest import TestCase
+
+from src.hockey.action import Action
+from src.hockey2.controller_polarity import ControllerPolarity
+from src.hockey2.game_record import GameRecord
+from src.hockey2.game_record import RecordReader
+from src.hockey2.game_record import RecordWriter
+from src.hockey2.game_record import replay
+
+
+class GameRecordTest(TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+        self.writer = RecordWriter(self.path)
+
+    def tearDown(self):
+        self.writer.close()
+        os.remove(self.path)
+
+    def play(self, seed):
+        rng = random.Random(seed)
+        controller = ControllerPolarity(11, 11, printer=lambda: self.writer, seed=seed)
+        controller.register('Bob')
+        controller.register('Malory')
+        history = []
+        while controller.result is None:
+            actions = controller.get_possible_actions(*controller.ball)
+            if not actions:
+                controller.forfeit('timeout')
+                break
+            controller.move(rng.choice(actions) | rng.choice([0, Action.POWER]))
+            history.append((controller.ball, controller.goal_by_player, controller.power_up))
+        return controller, history
+
+    def testReplayReachesEveryPly(self):
+        # seed 12 inverts the polarity on its final move
+        games = [self.play(seed) for seed in [0, 1, 2, 3, 4, 5, 12]]
+        reader = RecordReader(self.path)
+        self.assertEqual(7, len(reader))
+        for game, (controller, history) in enumerate(games):
+            record = reader[game]
+            self.assertEqual(['Bob', 'Malory'], record.players)
+            self.assertEqual(controller.power_up_position, record.power_up_position)
+            self.assertEqual(controller.result.reason, record.reason)
+            self.assertEqual(controller.players.index(controller.result.winner), record.winner)
+            self.assertEqual(len(controller.actions), len(record.moves))
+            for ply in sorted(set(range(1, len(record.moves), 7)) | set([len(record.moves)])):
+                replayed = replay(record, ply)
+                self.assertEqual(controller.actions[:ply], replayed.actions)
+                self.assertEqual(history[ply - 1], (replayed.ball, replayed.goal_by_player, replayed.power_up))
+            replayed = replay(record)
+            self.assertEqual(controller.result, replayed.result)
+            self.assertEqual((controller.goal_by_player, controller.inversions),
+                             (replayed.goal_by_player, replayed.inversions))
+        reader.close()
+
+    def testForfeitIsRecorded(self):
+        controller = ControllerPolarity(11, 11, printer=lambda: self.writer, seed=1)
+        controller.register('Bob')
+        controller.register('Malory')
+        controller.move(Action.NORTH)
+        controller.forfeit('timeout')
+        record, = list(RecordReader(self.path))
+        self.assertEqual((1, 0, 'timeout', 1), (record.seed, record.winner, record.reason, len(record.moves)))
+
+    def testHeaderLimitsRoundTrip(self):
+        moves = bytes(bytearray([Action.NORTH]) * 70000)
+        record = GameRecord(2 ** 32 - 1, 65535, 300, (65534, 299), ['Bob', 'Malory'], 1, 'timeout', moves)
+        decoded = GameRecord.decode(io.BytesIO(record.encode()))
+        self.assertEqual((2 ** 32 - 1, 65535, 300, (65534, 299), 1, 'timeout', moves),
+                         (decoded.seed, decoded.size_x, decoded.size_y, decoded.power_up_position, decoded.winner,
+                          decoded.reason, decoded.moves))
+
+    def testLongNamesAreRecorded(self):
+        name = u'é' * 300
+        controller = ControllerPolarity(11, 11, printer=lambda: self.writer, seed=1)
+        controller.register(name)
+        controller.register('Malory')
+        controller.forfeit('timeout')
+        record, = list(RecordReader(self.path))
+        self.assertEqual([name, 'Malory'], record.players)
+
+    def testTornTailEndsTheLog(self):
+        self.play(0)
+        self.play(1)
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        reader = RecordReader(self.path)
+        first = reader.index()[1]
+        reader.close()
+        for size in range(first, len(data)):
+            with open(self.path, 'wb') as f:
+                f.write(data[:size])
+            reader = RecordReader(self.path)
+            self.assertEqual(1, len(list(reader)))
+            self.assertEqual(1, len(reader))
+            reader.close()
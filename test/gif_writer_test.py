@@ -0,0 +1,74 @@
+import io
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from PIL import Image
+
+from src.hockey.action import Action
+from src.hockey.board_printer import BoardPrinterCurrent
+from src.hockey.board_printer import BoardPrinterFinal
+from src.hockey.controller import ControllerGentle
+from src.hockey.gif_writer import GifWriter
+
+
+class TemporaryPrinter(BoardPrinterCurrent):
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _get_filename_gif(self, players):
+        return os.path.join(self.directory, 'game.gif')
+
+    def _get_filename_png(self, players):
+        return os.path.join(self.directory, 'game.png')
+
+
+class TemporaryFinalPrinter(TemporaryPrinter, BoardPrinterFinal):
+    pass
+
+
+class GifWriterTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.controller = ControllerGentle(11, 11, printer=None)
+        self.controller.register('Bob')
+        self.controller.register('Malory')
+        for action in [Action.NORTH, Action.EAST, Action.SOUTH_EAST, Action.WEST]:
+            self.controller.move(action)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testFramesAtOffsets(self):
+        fp = io.BytesIO()
+        writer = GifWriter(fp)
+        writer.add_frame(Image.new('RGB', (40, 30), (255, 255, 255)))
+        writer.add_frame(Image.new('RGB', (10, 5), (255, 0, 0)), (20, 10))
+        writer.close()
+
+        fp.seek(0)
+        im = Image.open(fp)
+        self.assertEqual((40, 30), im.size)
+        self.assertEqual(2, im.n_frames)
+        im.seek(1)
+        frame = im.convert('RGB')
+        self.assertEqual((255, 0, 0), frame.getpixel((25, 12)))
+        self.assertEqual((255, 255, 255), frame.getpixel((5, 5)))
+
+    def testAnimatedGame(self):
+        TemporaryPrinter(self.directory).game_ended(self.controller)
+        im = Image.open(os.path.join(self.directory, 'game.gif'))
+        self.assertEqual((800, 600), im.size)
+        self.assertEqual(4, len(self.controller.actions))
+        self.assertEqual(5, im.n_frames)
+        for frame in range(im.n_frames):
+            im.seek(frame)
+            im.load()
+        im.close()
+
+    def testFinalBoard(self):
+        TemporaryFinalPrinter(self.directory).game_ended(self.controller)
+        im = Image.open(os.path.join(self.directory, 'game.png'))
+        self.assertEqual((800, 600), im.size)
+        im.close()
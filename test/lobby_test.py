@@ -0,0 +1,61 @@
+from unittest import TestCase
+
+from src.network.lobby import Lobby
+
+
+class FakeController(object):
+    def __init__(self):
+        self.players = []
+
+
+class FakeGateway(object):
+    on_end = None
+
+    def __init__(self):
+        self.controller = FakeController()
+        self.handlers = []
+        self.moves = []
+
+    def register_online(self, player_name, handler):
+        self.controller.players.append(player_name)
+        self.handlers.append(handler)
+
+    def move_player(self, name, action):
+        self.moves.append((name, action))
+
+
+class LobbyTest(TestCase):
+    def setUp(self):
+        self.lobby = Lobby(FakeGateway)
+
+    def testPairsPlayersInArrivalOrder(self):
+        for name in ['a', 'b', 'c', 'd', 'e']:
+            self.lobby.register_online(name, name.upper())
+        first, second = self.lobby.sessions['a'], self.lobby.sessions['c']
+        self.assertIsNot(first, second)
+        self.assertEqual(['a', 'b'], first.controller.players)
+        self.assertEqual(['C', 'D'], second.handlers)
+        self.assertEqual(['e'], list(self.lobby.waiting))
+
+    def testRoutesMovesToSession(self):
+        for name in ['a', 'b', 'c', 'd']:
+            self.lobby.register_online(name, name)
+        self.lobby.move_player('d', 3)
+        self.lobby.move_player('x', 3)
+        self.assertEqual([], self.lobby.sessions['a'].moves)
+        self.assertEqual([('d', 3)], self.lobby.sessions['c'].moves)
+
+    def testEndedSessionReleasesPlayers(self):
+        for name in ['a', 'b', 'c', 'd']:
+            self.lobby.register_online(name, name)
+        gateway = self.lobby.sessions['a']
+        gateway.on_end(gateway)
+        self.assertEqual({'c', 'd'}, set(self.lobby.sessions))
+        self.assertEqual(1, len(self.lobby.games()))
+
+    def testDisconnectWhileWaiting(self):
+        self.lobby.register_online('a', 'a')
+        self.lobby.unregister_online('a')
+        self.lobby.register_online('b', 'b')
+        self.assertEqual(['b'], list(self.lobby.waiting))
+        self.assertEqual({}, self.lobby.sessions)
@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from twisted.logger import Logger
+
+from src.arena.bots import Bot
+from src.arena.bots import RandomBot
+from src.arena.bots import alphabeta_bot
+from src.arena.bots import mcts_bot
+from src.arena.match import Match
+from src.arena.match import run_batch
+from src.hockey.controller import ControllerGentle
+from src.hockey2.controller_polarity import ControllerPolarity
+
+
+def gentle(seed):
+    return ControllerGentle(11, 11, printer=None)
+
+
+def polarity(seed):
+    return ControllerPolarity(15, 15, printer=None, seed=seed)
+
+
+class CrashingBot(Bot):
+    def play(self, controller):
+        raise ZeroDivisionError()
+
+
+class MatchTest(TestCase):
+    def testMatchIsReproducible(self):
+        match = Match(polarity, [RandomBot, RandomBot], ['a', 'b'])
+        first, second = match.play(42), match.play(42)
+        self.assertEqual((first.winner, first.reason, first.moves), (second.winner, second.reason, second.moves))
+        self.assertEqual(first.seed, second.seed)
+        self.assertIn(first.winner, ['a', 'b'])
+
+    def testSearchBotsAreReproducible(self):
+        match = Match(lambda seed: ControllerPolarity(11, 11, printer=None, seed=seed), [mcts_bot, alphabeta_bot],
+                      ['a', 'b'])
+        for seed in [3, 4]:
+            first, second = match.play(seed), match.play(seed)
+            self.assertEqual((first.winner, first.reason, first.moves),
+                             (second.winner, second.reason, second.moves))
+
+    def testCrashForfeitsAndIsLogged(self):
+        events = []
+        match = Match(gentle, [CrashingBot, RandomBot], ['a', 'b'])
+        match.log = Logger(observer=events.append)
+        result = match.play(1)
+        self.assertEqual(('b', 'opponent crashed'), (result.winner, result.reason))
+        self.assertTrue(events[0]['log_failure'].check(ZeroDivisionError))
+
+    def testBotMustPlay(self):
+        self.assertRaises(TypeError, Bot, 'a', None)
+
+    def testBatchReport(self):
+        report = run_batch(gentle, [RandomBot, RandomBot], ['a', 'b'], 20, seed=1)
+        self.assertEqual(20, report.games)
+        self.assertEqual(20, sum(report.reasons.values()))
+        self.assertEqual(20, report.wins['a'] + report.wins['b'])
+        self.assertTrue(report.average_length() > 0)
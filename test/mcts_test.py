@@ -0,0 +1,55 @@
+import random
+from unittest import TestCase
+
+from src.hockey.search_state import SearchState
+from src.search.mcts import MonteCarlo
+from src.search.mcts import search
+
+
+class MonteCarloTest(TestCase):
+    def testVisitsEveryRootMove(self):
+        state = SearchState.initial(11, 11, power_up_position=(3, 4))
+        statistics, rollouts = search(state, 0.2, seed=0)
+        self.assertEqual(sorted(state.moves()), sorted(statistics))
+        self.assertEqual(rollouts, sum(visits for visits, _ in statistics.values()))
+
+    def testFixedIterationsAreReproducible(self):
+        state = SearchState.initial(11, 11, power_up_position=(3, 4))
+        statistics, rollouts = search(state, 0.0, seed=5, iterations=60)
+        self.assertEqual(60, rollouts)
+        self.assertEqual((statistics, 60), search(state, 0.0, seed=5, iterations=60))
+        moves = [MonteCarlo(iterations=60, rng=random.Random(9)).best_move(state) for _ in range(2)]
+        self.assertEqual(moves[0], moves[1])
+
+    def testLeavesRootUntouched(self):
+        state = SearchState.initial(11, 11)
+        before = state.copy()
+        MonteCarlo(time_budget=0.05).best_move(state)
+        self.assertEqual(before.masks, state.masks)
+        self.assertEqual(before.ball, state.ball)
+        self.assertEqual(before.active, state.active)
+
+    def testTakesImmediateWin(self):
+        rng = random.Random(2)
+        search = MonteCarlo(time_budget=0.05)
+        checked = 0
+        for game in range(20):
+            state = SearchState.initial(11, 11)
+            while state.moves():
+                mover = state.active
+                winning = []
+                for move in state.moves():
+                    undo = state.make(move)
+                    if state.winner == mover:
+                        winning.append(move)
+                    state.unmake(undo)
+                if winning:
+                    best = search.best_move(state)
+                    undo = state.make(best)
+                    self.assertEqual(mover, state.winner)
+                    state.unmake(undo)
+                    checked += 1
+                    if checked >= 5:
+                        return
+                state.make(rng.choice(state.moves()))
+        self.assertTrue(checked > 0)
@@ -0,0 +1,92 @@
+from unittest import TestCase
+
+from twisted.internet.task import Clock
+from twisted.logger import LogLevel
+from twisted.logger import Logger
+
+from src.hockey.action import Action
+from src.hockey.controller import ControllerGentle
+from src.hockey2.controller_polarity import ControllerPolarity
+from src.network.deadline_scheduler import DeadlineScheduler
+from src.network.message_trace import MessageTrace
+from src.network.online_gateway import OnlineGateway
+from test.controller_test import BOB
+from test.controller_test import MALORY
+
+
+class FakeHandler(object):
+    def __init__(self):
+        self.messages = []
+        self.events = []
+        self.ended = False
+
+    def send_message(self, message, event=None):
+        self.messages.append(message)
+        self.events.append(event)
+
+    def end_game(self):
+        self.ended = True
+
+
+class OnlineGatewayTest(TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.gateway = OnlineGateway(lambda: ControllerGentle(11, 11, printer=None), timeout=0.5, debug=False,
+                                     scheduler=DeadlineScheduler(self.clock))
+        self.gateway.on_end = lambda gateway: None
+        self.bob, self.malory = FakeHandler(), FakeHandler()
+        self.gateway.register_online(BOB, self.bob)
+        self.gateway.register_online(MALORY, self.malory)
+
+    def testStartingGame(self):
+        self.assertEqual(['Game is on - 1', 'board size is (11, 11) - 3', 'ball is at (5, 5) - 5',
+                          'your goal is north - 7', 'Bob is active player - 9'], self.bob.messages)
+        self.assertEqual(['Game is on - 2', 'board size is (11, 11) - 4', 'ball is at (5, 5) - 6',
+                          'your goal is south - 8'], self.malory.messages)
+
+    def testTimeout(self):
+        self.clock.advance(0.4)
+        self.gateway.move_player(BOB, Action.NORTH)
+        self.clock.advance(0.4)
+        self.assertFalse(self.bob.ended)
+        self.clock.advance(0.2)
+        self.assertTrue(self.bob.ended and self.malory.ended)
+        self.assertEqual('Bob won : timeout - 13', self.malory.messages[-1])
+        self.assertEqual([], self.clock.getDelayedCalls())
+
+    def testInvalidMoveKeepsClock(self):
+        self.gateway.move_player(BOB, Action.NORTH)
+        self.clock.advance(0.4)
+        self.gateway.move_player(MALORY, Action.SOUTH)
+        self.clock.advance(0.2)
+        self.assertTrue(self.malory.ended)
+
+    def testStartLogsSeed(self):
+        events = []
+        gateway = OnlineGateway(lambda: ControllerPolarity(11, 11, printer=None, seed=99), timeout=0.5, debug=False,
+                                scheduler=DeadlineScheduler(self.clock))
+        gateway.log = Logger(observer=events.append)
+        gateway.register_online(BOB, FakeHandler())
+        gateway.register_online(MALORY, FakeHandler())
+        self.assertEqual(99, events[0]['seed'])
+
+    def testTraceIsLeveledAndSampled(self):
+        events = []
+        trace = MessageTrace(1.0)
+        gateway = OnlineGateway(lambda: ControllerGentle(11, 11, printer=None), timeout=0.5, debug=False,
+                                scheduler=DeadlineScheduler(self.clock), trace=trace)
+        gateway.log = Logger(observer=events.append)
+        gateway.on_end = lambda gateway: None
+        gateway.register_online(BOB, FakeHandler())
+        gateway.register_online(MALORY, FakeHandler())
+        traced = [event for event in events if 'msgid' in event]
+        self.assertEqual(list(range(1, 10)), [event['msgid'] for event in traced])
+        self.assertTrue(all(event['log_level'] == LogLevel.info for event in traced))
+        self.assertTrue(all(event['game_id'] == gateway.game_id for event in events))
+
+        trace.rate = 0.0
+        gateway.move_player(BOB, Action.NORTH)
+        self.clock.advance(0.5)
+        self.assertEqual(len(traced) + 2, len(events))
+        self.assertEqual((LogLevel.info, BOB, 'timeout'), (events[-1]['log_level'], events[-1]['winner'],
+                                                           events[-1]['reason']))
@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from src.hockey.action import Action
+from src.hockey.search_state import SearchState
+from src.hockey2.game_archive import GameArchive
+from src.hockey2.game_archive import build_archive
+from src.hockey2.game_record import GameRecord
+from src.hockey2.game_record import SECOND_PLAYER
+from src.search.opening_book import OpeningBook
+from src.search.opening_book import OpeningBookBuilder
+from src.search.opening_book import position_key
+
+
+def record(winner, moves, power_up_position=(2, 3)):
+    return GameRecord(7, 11, 11, power_up_position, ['Bob', 'Malory'], winner, 'a goal was made',
+                      bytes(bytearray(moves)))
+
+
+class OpeningBookTest(TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.book = os.path.join(self.path, 'book.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def build(self, records, plies=4, min_games=2):
+        builder = OpeningBookBuilder(11, 11, plies, min_games)
+        for game in records:
+            builder.add(game)
+        builder.save(self.book)
+        return OpeningBook(self.book)
+
+    def testBestMoveByWinRate(self):
+        book = self.build([record(0, [Action.NORTH, SECOND_PLAYER | Action.EAST]),
+                           record(0, [Action.NORTH, SECOND_PLAYER | Action.EAST]),
+                           record(1, [Action.WEST, SECOND_PLAYER | Action.EAST]),
+                           record(1, [Action.WEST, SECOND_PLAYER | Action.EAST]),
+                           record(0, [Action.SOUTH])])
+        state = SearchState.initial(11, 11, (2, 3))
+        self.assertEqual(Action.NORTH, book.move(state))
+        entry = book.lookup(position_key(book.zobrist, state))
+        self.assertEqual((2, 2, 5), (entry['games'], entry['wins'], entry['visits']))
+
+        state.make(Action.NORTH)
+        self.assertEqual(Action.EAST, book.move(state))
+        entry = book.lookup(position_key(book.zobrist, state))
+        self.assertEqual((2, 0), (entry['games'], entry['wins']))
+
+    def testUnknownPositions(self):
+        book = self.build([record(0, [Action.NORTH])] * 3)
+        self.assertIsNone(book.move(SearchState.initial(11, 11, (5, 1))))
+        self.assertIsNone(book.move(SearchState.initial(9, 9)))
+
+        state = SearchState.initial(11, 11, (2, 3))
+        state.make(Action.NORTH)
+        self.assertIsNone(book.move(state))
+
+    def testFromArchive(self):
+        archive = os.path.join(self.path, 'archive')
+        build_archive([record(1, [Action.EAST])] * 2, archive)
+        book = self.build(GameArchive(archive).records())
+        self.assertEqual(Action.EAST, book.move(SearchState.initial(11, 11, (2, 3))))
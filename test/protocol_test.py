@@ -0,0 +1,78 @@
+import json
+from unittest import TestCase
+
+from twisted.internet.task import Clock
+from twisted.internet.testing import StringTransport
+
+from src.hockey.action import Action
+from src.hockey.controller import ControllerGentle
+from src.network.deadline_scheduler import DeadlineScheduler
+from src.network.lobby import Lobby
+from src.network.online_gateway import OnlineGateway
+from src.network.protocol import JSON
+from src.network.protocol import TEXT
+from src.network.protocol import decode_action
+from src.network.protocol import negotiate
+from src.network.registry import ConnectionRegistry
+from src.network2.communication import CommunicationP2
+from src.network2.communication import POSSIBILITIES
+
+
+def connect(lobby, registry, clock, *lines):
+    communication = CommunicationP2(registry, lobby)
+    communication.clock = clock
+    transport = StringTransport()
+    communication.makeConnection(transport)
+    for line in lines:
+        communication.lineReceived(line.encode('UTF-8'))
+    return communication, transport
+
+
+def received(transport, clock):
+    clock.advance(0)
+    lines = transport.value().decode('UTF-8').split('\r\n')[:-1]
+    transport.clear()
+    return lines
+
+
+class ProtocolTest(TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.lobby = Lobby(lambda: OnlineGateway(lambda: ControllerGentle(11, 11, printer=None), timeout=5,
+                                                 debug=False, scheduler=DeadlineScheduler(self.clock)))
+        self.registry = ConnectionRegistry()
+
+    def testNegotiate(self):
+        self.assertEqual((JSON, False), negotiate('protocol json'))
+        self.assertEqual((JSON, True), negotiate('protocol json snapshot'))
+        self.assertEqual((TEXT, False), negotiate('protocol text'))
+        self.assertIsNone(negotiate('protocol'))
+        self.assertIsNone(negotiate('Bob'))
+
+    def testDecodeAction(self):
+        self.assertEqual(Action.NORTH | Action.POWER, decode_action(TEXT, 'Power North', POSSIBILITIES))
+        self.assertEqual(Action.EAST, decode_action(JSON, '{"action": 2}', POSSIBILITIES))
+        self.assertIsNone(decode_action(JSON, '{"action": 16}', POSSIBILITIES))
+        self.assertIsNone(decode_action(JSON, 'north', POSSIBILITIES))
+        self.assertIsNone(decode_action(JSON, '[2]', POSSIBILITIES))
+
+    def testJsonAlongsideText(self):
+        bob, bob_transport = connect(self.lobby, self.registry, self.clock, 'protocol json snapshot', 'Bob')
+        malory, malory_transport = connect(self.lobby, self.registry, self.clock, 'Malory')
+
+        lines = received(bob_transport, self.clock)
+        self.assertEqual("What's your name?", lines[0])
+        events = [json.loads(line) for line in lines[1:]]
+        self.assertEqual(['protocol', 'welcome', 'game_on', 'size', 'ball', 'goal', 'active'],
+                         [event['kind'] for event in events])
+        self.assertEqual({'kind': 'ball', 'position': [5, 5], 'id': 5}, events[4])
+        self.assertEqual({'ball': [5, 5], 'active': 'Bob', 'north_player': 'Bob', 'moves': []}, events[-1]['state'])
+        self.assertIn('ball is at (5, 5) - 6', received(malory_transport, self.clock))
+
+        bob.lineReceived(b'{"action": 0}')
+        event = json.loads(received(bob_transport, self.clock)[0])
+        self.assertEqual({'kind': 'action', 'player': 'Bob', 'action': Action.NORTH, 'id': 11}, event)
+        self.assertEqual(['Bob did go north - 10', 'Malory is active player - 12'], received(malory_transport, self.clock))
+
+        bob.lineReceived(b'north')
+        self.assertEqual({'kind': 'error', 'error': 'invalid action'}, json.loads(received(bob_transport, self.clock)[0]))
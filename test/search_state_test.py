@@ -0,0 +1,59 @@
+import random
+from unittest import TestCase
+
+from src.hockey.action import Action
+from src.hockey.controller import Controller
+from src.hockey.search_state import SearchState
+from src.hockey2.controller_polarity import ControllerPolarity
+
+
+class SearchStateTest(TestCase):
+    def legal_actions(self, controller):
+        x, y = controller.ball
+        return [action for action in controller.get_possible_actions(x, y)
+                if controller.board.has_dot(x + Action.delta[action][0], y + Action.delta[action][1])]
+
+    def assertSameState(self, controller, state):
+        self.assertEqual(controller.ball, state.position())
+        self.assertEqual(controller.active_player, state.active)
+        self.assertEqual(controller.power_up if controller.power_up is not None else -1, state.power_up)
+
+    def testInitialState(self):
+        controller = Controller(15, 15, printer=None)
+        state = SearchState.initial(15, 15)
+        self.assertEqual(self.legal_actions(controller), state.moves())
+        self.assertSameState(ControllerPolarity(15, 15, printer=None), state)
+
+    def testPlayoutsMatchController(self):
+        rng = random.Random(1)
+        for seed in range(30):
+            controller = ControllerPolarity(15, 15, printer=None, seed=seed)
+            controller.register('Bob')
+            controller.register('Malory')
+            state = SearchState.from_controller(controller)
+            while True:
+                moves = state.moves()
+                self.assertEqual(self.legal_actions(controller), [move for move in moves if move < Action.POWER])
+                action = rng.choice(moves)
+                state.make(action)
+                result, inverted = controller.move(action)
+                self.assertTrue(result.valid)
+                if result.terminated:
+                    self.assertEqual(controller.players[state.winner], result.winner)
+                    self.assertEqual([], state.moves())
+                    break
+                self.assertEqual(-1, state.winner)
+                self.assertSameState(controller, state)
+                if inverted:
+                    state.invert_polarity()
+
+    def testUnmakeRestoresState(self):
+        rng = random.Random(2)
+        state = SearchState.initial(11, 11, power_up_position=(3, 4))
+        original = state.copy()
+        undos = []
+        while state.moves():
+            undos.append(state.make(rng.choice(state.moves())))
+        for undo in reversed(undos):
+            state.unmake(undo)
+        self.assertEqual(original.__dict__, state.__dict__)
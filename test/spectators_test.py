@@ -0,0 +1,72 @@
+import json
+from unittest import TestCase
+
+from twisted.internet.task import Clock
+from twisted.internet.testing import StringTransport
+
+from src.hockey.action import Action
+from src.hockey.controller import ControllerGentle
+from src.network.deadline_scheduler import DeadlineScheduler
+from src.network.online_gateway import OnlineGateway
+from src.network.spectators import SpectatorFactory
+from src.network.spectators import SpectatorHub
+from test.controller_test import BOB
+from test.controller_test import MALORY
+from test.online_gateway_test import FakeHandler
+
+
+def watch(hub, max_buffered=256):
+    spectator = SpectatorFactory(hub, max_buffered).buildProtocol(None)
+    transport = StringTransport()
+    spectator.makeConnection(transport)
+    return spectator, transport
+
+
+def events(transport):
+    return [json.loads(line) for line in transport.value().decode('UTF-8').split('\r\n')[:-1]]
+
+
+class SpectatorsTest(TestCase):
+    def setUp(self):
+        self.hub = SpectatorHub()
+        self.clock = Clock()
+
+    def _game(self):
+        gateway = OnlineGateway(lambda: ControllerGentle(11, 11, printer=None), timeout=0.5, debug=False,
+                                scheduler=DeadlineScheduler(self.clock), spectators=self.hub)
+        gateway.on_end = lambda gateway: None
+        gateway.register_online(BOB, FakeHandler())
+        gateway.register_online(MALORY, FakeHandler())
+        return gateway
+
+    def testFollowsGames(self):
+        spectator, transport = watch(self.hub)
+        gateway = self._game()
+        gateway.move_player(BOB, Action.NORTH)
+        self.clock.advance(0.5)
+        received = events(transport)
+        self.assertEqual(['start', 'game_on', 'size', 'ball', 'active', 'action', 'active', 'end'],
+                         [event['kind'] for event in received])
+        self.assertTrue(all(event['game'] == gateway.game_id for event in received))
+        self.assertEqual([BOB, MALORY], received[0]['players'])
+
+        spectator.lineReceived(b'watch elsewhere')
+        self._game()
+        self.assertEqual(len(received), len(events(transport)))
+
+    def testSlowSpectatorDropsOldest(self):
+        slow, slow_transport = watch(self.hub, max_buffered=2)
+        fast, fast_transport = watch(self.hub)
+        slow.pauseProducing()
+        self._game()
+        self.assertEqual(5, len(events(fast_transport)))
+        self.assertEqual([], events(slow_transport))
+        self.assertEqual(3, slow.dropped)
+
+        slow.resumeProducing()
+        received = events(slow_transport)
+        self.assertEqual({'kind': 'dropped', 'count': 3}, received[0])
+        self.assertEqual(['ball', 'active'], [event['kind'] for event in received[1:]])
+
+        slow.connectionLost(None)
+        self.assertEqual({'subscribers': 1, 'published': 5, 'dropped': 0}, self.hub.stats())
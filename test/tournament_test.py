@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from src.arena.tournament import ResultLog
+from src.arena.tournament import Tournament
+
+
+class TournamentTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def tournament(self, games):
+        return Tournament({'a': 'random', 'b': 'random', 'c': 'random'}, games, seed=7, size=(11, 11), gentle=True,
+                          workers=2)
+
+    def testRoundRobinResumes(self):
+        path = os.path.join(self.directory, 'results.jsonl')
+        self.tournament(2).run(ResultLog(path))
+        first = dict((record['match'], record) for record in ResultLog(path).read())
+        self.assertEqual(6, len(first))
+
+        standings = self.tournament(4).run(ResultLog(path))
+        records = ResultLog(path).read()
+        self.assertEqual(12, len(records))
+        self.assertEqual(12, sum(standings.values()))
+        for record in records:
+            if record['match'] in first:
+                self.assertEqual(first[record['match']], record)
+
+    def testSwissIsReproducible(self):
+        runs = []
+        for name in ['first.csv', 'second.csv']:
+            path = os.path.join(self.directory, name)
+            self.tournament(2).run(ResultLog(path), swiss_rounds=2)
+            runs.append(sorted((r['match'], r['winner'], r['moves']) for r in ResultLog(path).read()))
+        self.assertEqual(runs[0], runs[1])
+        self.assertEqual(4, len(runs[0]))
+
+    def testSwissResumes(self):
+        path = os.path.join(self.directory, 'results.jsonl')
+        self.tournament(2).run(ResultLog(path), swiss_rounds=2)
+        complete = sorted((r['match'], r['winner'], r['moves']) for r in ResultLog(path).read())
+
+        self.tournament(2).run(ResultLog(path), swiss_rounds=2)
+        self.assertEqual(complete, sorted((r['match'], r['winner'], r['moves']) for r in ResultLog(path).read()))
+
+        with open(path) as f:
+            lines = f.readlines()
+        half = os.path.join(self.directory, 'half.jsonl')
+        with open(half, 'w') as f:
+            f.writelines([line for line in lines if '"round": 0' in line] +
+                         [line for line in lines if '"round": 1' in line][:1])
+        self.tournament(2).run(ResultLog(half), swiss_rounds=2)
+        self.assertEqual(complete, sorted((r['match'], r['winner'], r['moves']) for r in ResultLog(half).read()))
+
+    def testTornLastLineIsReplayed(self):
+        for name in ['results.jsonl', 'results.csv']:
+            path = os.path.join(self.directory, name)
+            self.tournament(1).run(ResultLog(path))
+            complete = sorted((r['match'], r['winner'], r['moves']) for r in ResultLog(path).read())
+            with open(path, 'rb+') as f:
+                f.truncate(os.path.getsize(path) - 5)
+
+            self.assertEqual(2, len(ResultLog(path).read()))
+            self.tournament(1).run(ResultLog(path))
+            self.assertEqual(complete, sorted((r['match'], r['winner'], r['moves']) for r in ResultLog(path).read()))